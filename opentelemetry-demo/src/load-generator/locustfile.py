@@ -4,17 +4,20 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
+import contextvars
 import json
 import os
 import random
 import uuid
 import logging
 
-from locust import HttpUser, task, between
+import gevent
+from geventhttpclient.client import HTTPClientPool
+from locust import FastHttpUser, HttpUser, User, task, between
 from locust_plugins.users.playwright import PlaywrightUser, pw, PageWithRetry, event
 
-from opentelemetry import context, baggage, trace
-from opentelemetry.metrics import set_meter_provider
+from opentelemetry import context, baggage, propagate, trace
+from opentelemetry.metrics import get_meter, set_meter_provider, CallbackOptions, Observation
 from opentelemetry.sdk.metrics import MeterProvider
 from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
 from opentelemetry.sdk.trace import TracerProvider
@@ -73,11 +76,60 @@ base_url = f"http://{os.environ.get('FLAGD_HOST', 'localhost')}:{os.environ.get(
 api.set_provider(OFREPProvider(base_url=base_url))
 api.add_hooks([TracingHook()])
 
-def get_flagd_value(FlagName):
+def evaluate_flag(FlagName):
     # Initialize OpenFeature
     client = api.get_client()
     return client.get_integer_value(FlagName, 0)
 
+
+class FlagSnapshot:
+    """Flag values shared by all users of the process.
+
+    A flag is evaluated through OFREP when it is first read, then re-evaluated
+    every ``interval`` seconds by a single poller greenlet, so tasks read a
+    local value instead of making a remote call on every run.
+    """
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.values = {}
+        self.evaluations_avoided = 0
+        self._poller = None
+
+    def get(self, flag_name):
+        if flag_name in self.values:
+            self.evaluations_avoided += 1
+            return self.values[flag_name]
+        value = self.values[flag_name] = evaluate_flag(flag_name)
+        if self._poller is None:
+            self._poller = gevent.spawn(self._poll)
+        return value
+
+    def _poll(self):
+        while True:
+            gevent.sleep(self.interval)
+            for flag_name in list(self.values):
+                try:
+                    self.values[flag_name] = evaluate_flag(flag_name)
+                except Exception as e:
+                    logging.warning(f"Flag refresh failed for {flag_name}: {e}")
+
+
+flag_snapshot = FlagSnapshot(float(os.environ.get("LOCUST_FLAG_REFRESH_SECONDS", 5)))
+
+
+def observe_flag_evaluations_avoided(options: CallbackOptions):
+    return [Observation(flag_snapshot.evaluations_avoided)]
+
+
+get_meter("load-generator").create_observable_counter(
+    "app_flag_evaluations_avoided", callbacks=[observe_flag_evaluations_avoided], unit="evaluations",
+    description="Feature flag evaluations answered from the load generator's flag snapshot instead of OFREP")
+
+
+def get_flagd_value(FlagName):
+    return flag_snapshot.get(FlagName)
+
 categories = [
     "binoculars",
     "telescopes",
@@ -104,8 +156,15 @@ products = [
 people_file = open('people.json')
 people = json.load(people_file)
 
-class WebsiteUser(HttpUser):
-    wait_time = between(1, 10)
+def new_session_context():
+    ctx = baggage.set_baggage("session.id", str(uuid.uuid4()))
+    return baggage.set_baggage("synthetic_request", "true", context=ctx)
+
+
+class WebsiteTasks(User):
+    # Tasks and weights shared by WebsiteUser and FastWebsiteUser
+    abstract = True
+    wait_time = between(float(os.environ.get("LOCUST_WAIT_MIN", 1)), float(os.environ.get("LOCUST_WAIT_MAX", 10)))
 
     @task(1)
     def index(self):
@@ -139,6 +198,9 @@ class WebsiteUser(HttpUser):
             user = str(uuid.uuid1())
         product = random.choice(products)
         self.client.get("/api/products/" + product)
+        self.post_cart_item(user, product)
+
+    def post_cart_item(self, user, product):
         cart_item = {
             "item": {
                 "productId": product,
@@ -161,8 +223,14 @@ class WebsiteUser(HttpUser):
     def checkout_multi(self):
         # checkout call which adds 2-4 different items to cart before checkout
         user = str(uuid.uuid1())
-        for i in range(random.choice([2, 3, 4])):
-            self.add_to_cart(user=user)
+        cart = [random.choice(products) for _ in range(random.choice([2, 3, 4]))]
+        # The product pages are independent and fetched concurrently, each
+        # greenlet in a copy of this one's context (session baggage); the cart
+        # updates read and write the same cart, so they stay sequential
+        gevent.joinall([gevent.spawn(contextvars.copy_context().run, self.client.get, "/api/products/" + product)
+                        for product in cart], raise_error=True)
+        for product in cart:
+            self.post_cart_item(user, product)
         checkout_person = random.choice(people)
         checkout_person["userId"] = user
         self.client.post("/api/checkout", json=checkout_person)
@@ -173,12 +241,35 @@ class WebsiteUser(HttpUser):
             self.client.get("/")
 
     def on_start(self):
-        ctx = baggage.set_baggage("session.id", str(uuid.uuid4()))
-        ctx = baggage.set_baggage("synthetic_request", "true", context=ctx)
-        context.attach(ctx)
+        context.attach(new_session_context())
         self.index()
 
 
+fast_http_enabled = os.environ.get("LOCUST_FAST_HTTP_ENABLED", "").lower() in ("true", "yes", "on")
+
+if fast_http_enabled:
+    class FastWebsiteUser(WebsiteTasks, FastHttpUser):
+        # geventhttpclient instead of requests: about a quarter of the CPU per
+        # request, so one container can run about four times as many users.
+        # All users of the process share a pool of keep-alive connections.
+        client_pool = HTTPClientPool(
+            concurrency=int(os.environ.get("LOCUST_FAST_HTTP_CONNECTIONS", 100)),
+            network_timeout=FastHttpUser.network_timeout,
+            connection_timeout=FastHttpUser.connection_timeout,
+            insecure=FastHttpUser.insecure,
+        )
+
+        def on_start(self):
+            ctx = new_session_context()
+            context.attach(ctx)
+            # geventhttpclient is not instrumented, send the session baggage with every request
+            propagate.inject(self.client.client.default_headers, context=ctx)
+            self.index()
+else:
+    class WebsiteUser(WebsiteTasks, HttpUser):
+        pass
+
+
 browser_traffic_enabled = os.environ.get("LOCUST_BROWSER_TRAFFIC_ENABLED", "").lower() in ("true", "yes", "on")
 
 if browser_traffic_enabled:
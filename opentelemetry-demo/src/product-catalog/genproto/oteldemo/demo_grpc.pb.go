@@ -211,7 +211,9 @@ var CartService_ServiceDesc = grpc.ServiceDesc{
 }
 
 const (
-	RecommendationService_ListRecommendations_FullMethodName = "/oteldemo.RecommendationService/ListRecommendations"
+	RecommendationService_ListRecommendations_FullMethodName        = "/oteldemo.RecommendationService/ListRecommendations"
+	RecommendationService_ListRecommendationsBatch_FullMethodName   = "/oteldemo.RecommendationService/ListRecommendationsBatch"
+	RecommendationService_StreamRecommendationsBatch_FullMethodName = "/oteldemo.RecommendationService/StreamRecommendationsBatch"
 )
 
 // RecommendationServiceClient is the client API for RecommendationService service.
@@ -219,6 +221,10 @@ const (
 // For semantics around ctx use and closing/ending streaming RPCs, please refer to https://pkg.go.dev/google.golang.org/grpc/?tab=doc#ClientConn.NewStream.
 type RecommendationServiceClient interface {
 	ListRecommendations(ctx context.Context, in *ListRecommendationsRequest, opts ...grpc.CallOption) (*ListRecommendationsResponse, error)
+	// Answers every request from the same catalog snapshot, responses in request order
+	ListRecommendationsBatch(ctx context.Context, in *ListRecommendationsBatchRequest, opts ...grpc.CallOption) (*ListRecommendationsBatchResponse, error)
+	// Streaming variant for very large batches, one response per request in request order
+	StreamRecommendationsBatch(ctx context.Context, in *ListRecommendationsBatchRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[ListRecommendationsResponse], error)
 }
 
 type recommendationServiceClient struct {
@@ -239,11 +245,44 @@ func (c *recommendationServiceClient) ListRecommendations(ctx context.Context, i
 	return out, nil
 }
 
+func (c *recommendationServiceClient) ListRecommendationsBatch(ctx context.Context, in *ListRecommendationsBatchRequest, opts ...grpc.CallOption) (*ListRecommendationsBatchResponse, error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	out := new(ListRecommendationsBatchResponse)
+	err := c.cc.Invoke(ctx, RecommendationService_ListRecommendationsBatch_FullMethodName, in, out, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
+func (c *recommendationServiceClient) StreamRecommendationsBatch(ctx context.Context, in *ListRecommendationsBatchRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[ListRecommendationsResponse], error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	stream, err := c.cc.NewStream(ctx, &RecommendationService_ServiceDesc.Streams[0], RecommendationService_StreamRecommendationsBatch_FullMethodName, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	x := &grpc.GenericClientStream[ListRecommendationsBatchRequest, ListRecommendationsResponse]{ClientStream: stream}
+	if err := x.ClientStream.SendMsg(in); err != nil {
+		return nil, err
+	}
+	if err := x.ClientStream.CloseSend(); err != nil {
+		return nil, err
+	}
+	return x, nil
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type RecommendationService_StreamRecommendationsBatchClient = grpc.ServerStreamingClient[ListRecommendationsResponse]
+
 // RecommendationServiceServer is the server API for RecommendationService service.
 // All implementations must embed UnimplementedRecommendationServiceServer
 // for forward compatibility.
 type RecommendationServiceServer interface {
 	ListRecommendations(context.Context, *ListRecommendationsRequest) (*ListRecommendationsResponse, error)
+	// Answers every request from the same catalog snapshot, responses in request order
+	ListRecommendationsBatch(context.Context, *ListRecommendationsBatchRequest) (*ListRecommendationsBatchResponse, error)
+	// Streaming variant for very large batches, one response per request in request order
+	StreamRecommendationsBatch(*ListRecommendationsBatchRequest, grpc.ServerStreamingServer[ListRecommendationsResponse]) error
 	mustEmbedUnimplementedRecommendationServiceServer()
 }
 
@@ -257,6 +296,12 @@ type UnimplementedRecommendationServiceServer struct{}
 func (UnimplementedRecommendationServiceServer) ListRecommendations(context.Context, *ListRecommendationsRequest) (*ListRecommendationsResponse, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method ListRecommendations not implemented")
 }
+func (UnimplementedRecommendationServiceServer) ListRecommendationsBatch(context.Context, *ListRecommendationsBatchRequest) (*ListRecommendationsBatchResponse, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method ListRecommendationsBatch not implemented")
+}
+func (UnimplementedRecommendationServiceServer) StreamRecommendationsBatch(*ListRecommendationsBatchRequest, grpc.ServerStreamingServer[ListRecommendationsResponse]) error {
+	return status.Errorf(codes.Unimplemented, "method StreamRecommendationsBatch not implemented")
+}
 func (UnimplementedRecommendationServiceServer) mustEmbedUnimplementedRecommendationServiceServer() {}
 func (UnimplementedRecommendationServiceServer) testEmbeddedByValue()                               {}
 
@@ -296,6 +341,35 @@ func _RecommendationService_ListRecommendations_Handler(srv interface{}, ctx con
 	return interceptor(ctx, in, info, handler)
 }
 
+func _RecommendationService_ListRecommendationsBatch_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(ListRecommendationsBatchRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(RecommendationServiceServer).ListRecommendationsBatch(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: RecommendationService_ListRecommendationsBatch_FullMethodName,
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(RecommendationServiceServer).ListRecommendationsBatch(ctx, req.(*ListRecommendationsBatchRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
+func _RecommendationService_StreamRecommendationsBatch_Handler(srv interface{}, stream grpc.ServerStream) error {
+	m := new(ListRecommendationsBatchRequest)
+	if err := stream.RecvMsg(m); err != nil {
+		return err
+	}
+	return srv.(RecommendationServiceServer).StreamRecommendationsBatch(m, &grpc.GenericServerStream[ListRecommendationsBatchRequest, ListRecommendationsResponse]{ServerStream: stream})
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type RecommendationService_StreamRecommendationsBatchServer = grpc.ServerStreamingServer[ListRecommendationsResponse]
+
 // RecommendationService_ServiceDesc is the grpc.ServiceDesc for RecommendationService service.
 // It's only intended for direct use with grpc.RegisterService,
 // and not to be introspected or modified (even as a copy)
@@ -307,8 +381,18 @@ var RecommendationService_ServiceDesc = grpc.ServiceDesc{
 			MethodName: "ListRecommendations",
 			Handler:    _RecommendationService_ListRecommendations_Handler,
 		},
+		{
+			MethodName: "ListRecommendationsBatch",
+			Handler:    _RecommendationService_ListRecommendationsBatch_Handler,
+		},
+	},
+	Streams: []grpc.StreamDesc{
+		{
+			StreamName:    "StreamRecommendationsBatch",
+			Handler:       _RecommendationService_StreamRecommendationsBatch_Handler,
+			ServerStreams: true,
+		},
 	},
-	Streams:  []grpc.StreamDesc{},
 	Metadata: "demo.proto",
 }
 
@@ -12,7 +12,9 @@ import {
   ChannelCredentials,
   Client,
   type ClientOptions,
+  type ClientReadableStream,
   type ClientUnaryCall,
+  type handleServerStreamingCall,
   type handleUnaryCall,
   makeGenericClientConstructor,
   Metadata,
@@ -59,6 +61,14 @@ export interface ListRecommendationsResponse {
   productIds: string[];
 }
 
+export interface ListRecommendationsBatchRequest {
+  requests: ListRecommendationsRequest[];
+}
+
+export interface ListRecommendationsBatchResponse {
+  responses: ListRecommendationsResponse[];
+}
+
 export interface Product {
   id: string;
   name: string;
@@ -773,6 +783,134 @@ export const ListRecommendationsResponse = {
   },
 };
 
+function createBaseListRecommendationsBatchRequest(): ListRecommendationsBatchRequest {
+  return { requests: [] };
+}
+
+export const ListRecommendationsBatchRequest = {
+  encode(message: ListRecommendationsBatchRequest, writer: _m0.Writer = _m0.Writer.create()): _m0.Writer {
+    for (const v of message.requests) {
+      ListRecommendationsRequest.encode(v!, writer.uint32(10).fork()).ldelim();
+    }
+    return writer;
+  },
+
+  decode(input: _m0.Reader | Uint8Array, length?: number): ListRecommendationsBatchRequest {
+    const reader = input instanceof _m0.Reader ? input : _m0.Reader.create(input);
+    let end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseListRecommendationsBatchRequest();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1:
+          if (tag !== 10) {
+            break;
+          }
+
+          message.requests.push(ListRecommendationsRequest.decode(reader, reader.uint32()));
+          continue;
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skipType(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): ListRecommendationsBatchRequest {
+    return {
+      requests: globalThis.Array.isArray(object?.requests)
+        ? object.requests.map((e: any) => ListRecommendationsRequest.fromJSON(e))
+        : [],
+    };
+  },
+
+  toJSON(message: ListRecommendationsBatchRequest): unknown {
+    const obj: any = {};
+    if (message.requests?.length) {
+      obj.requests = message.requests.map((e) => ListRecommendationsRequest.toJSON(e));
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<ListRecommendationsBatchRequest>, I>>(base?: I): ListRecommendationsBatchRequest {
+    return ListRecommendationsBatchRequest.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<ListRecommendationsBatchRequest>, I>>(
+    object: I,
+  ): ListRecommendationsBatchRequest {
+    const message = createBaseListRecommendationsBatchRequest();
+    message.requests = object.requests?.map((e) => ListRecommendationsRequest.fromPartial(e)) || [];
+    return message;
+  },
+};
+
+function createBaseListRecommendationsBatchResponse(): ListRecommendationsBatchResponse {
+  return { responses: [] };
+}
+
+export const ListRecommendationsBatchResponse = {
+  encode(message: ListRecommendationsBatchResponse, writer: _m0.Writer = _m0.Writer.create()): _m0.Writer {
+    for (const v of message.responses) {
+      ListRecommendationsResponse.encode(v!, writer.uint32(10).fork()).ldelim();
+    }
+    return writer;
+  },
+
+  decode(input: _m0.Reader | Uint8Array, length?: number): ListRecommendationsBatchResponse {
+    const reader = input instanceof _m0.Reader ? input : _m0.Reader.create(input);
+    let end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseListRecommendationsBatchResponse();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1:
+          if (tag !== 10) {
+            break;
+          }
+
+          message.responses.push(ListRecommendationsResponse.decode(reader, reader.uint32()));
+          continue;
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skipType(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): ListRecommendationsBatchResponse {
+    return {
+      responses: globalThis.Array.isArray(object?.responses)
+        ? object.responses.map((e: any) => ListRecommendationsResponse.fromJSON(e))
+        : [],
+    };
+  },
+
+  toJSON(message: ListRecommendationsBatchResponse): unknown {
+    const obj: any = {};
+    if (message.responses?.length) {
+      obj.responses = message.responses.map((e) => ListRecommendationsResponse.toJSON(e));
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<ListRecommendationsBatchResponse>, I>>(
+    base?: I,
+  ): ListRecommendationsBatchResponse {
+    return ListRecommendationsBatchResponse.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<ListRecommendationsBatchResponse>, I>>(
+    object: I,
+  ): ListRecommendationsBatchResponse {
+    const message = createBaseListRecommendationsBatchResponse();
+    message.responses = object.responses?.map((e) => ListRecommendationsResponse.fromPartial(e)) || [];
+    return message;
+  },
+};
+
 function createBaseProduct(): Product {
   return { id: "", name: "", description: "", picture: "", priceUsd: undefined, categories: [] };
 }
@@ -3413,10 +3551,38 @@ export const RecommendationServiceService = {
       Buffer.from(ListRecommendationsResponse.encode(value).finish()),
     responseDeserialize: (value: Buffer) => ListRecommendationsResponse.decode(value),
   },
+  /** Answers every request from the same catalog snapshot, responses in request order */
+  listRecommendationsBatch: {
+    path: "/oteldemo.RecommendationService/ListRecommendationsBatch",
+    requestStream: false,
+    responseStream: false,
+    requestSerialize: (value: ListRecommendationsBatchRequest) =>
+      Buffer.from(ListRecommendationsBatchRequest.encode(value).finish()),
+    requestDeserialize: (value: Buffer) => ListRecommendationsBatchRequest.decode(value),
+    responseSerialize: (value: ListRecommendationsBatchResponse) =>
+      Buffer.from(ListRecommendationsBatchResponse.encode(value).finish()),
+    responseDeserialize: (value: Buffer) => ListRecommendationsBatchResponse.decode(value),
+  },
+  /** Streaming variant for very large batches, one response per request in request order */
+  streamRecommendationsBatch: {
+    path: "/oteldemo.RecommendationService/StreamRecommendationsBatch",
+    requestStream: false,
+    responseStream: true,
+    requestSerialize: (value: ListRecommendationsBatchRequest) =>
+      Buffer.from(ListRecommendationsBatchRequest.encode(value).finish()),
+    requestDeserialize: (value: Buffer) => ListRecommendationsBatchRequest.decode(value),
+    responseSerialize: (value: ListRecommendationsResponse) =>
+      Buffer.from(ListRecommendationsResponse.encode(value).finish()),
+    responseDeserialize: (value: Buffer) => ListRecommendationsResponse.decode(value),
+  },
 } as const;
 
 export interface RecommendationServiceServer extends UntypedServiceImplementation {
   listRecommendations: handleUnaryCall<ListRecommendationsRequest, ListRecommendationsResponse>;
+  /** Answers every request from the same catalog snapshot, responses in request order */
+  listRecommendationsBatch: handleUnaryCall<ListRecommendationsBatchRequest, ListRecommendationsBatchResponse>;
+  /** Streaming variant for very large batches, one response per request in request order */
+  streamRecommendationsBatch: handleServerStreamingCall<ListRecommendationsBatchRequest, ListRecommendationsResponse>;
 }
 
 export interface RecommendationServiceClient extends Client {
@@ -3435,6 +3601,32 @@ export interface RecommendationServiceClient extends Client {
     options: Partial<CallOptions>,
     callback: (error: ServiceError | null, response: ListRecommendationsResponse) => void,
   ): ClientUnaryCall;
+  /** Answers every request from the same catalog snapshot, responses in request order */
+  listRecommendationsBatch(
+    request: ListRecommendationsBatchRequest,
+    callback: (error: ServiceError | null, response: ListRecommendationsBatchResponse) => void,
+  ): ClientUnaryCall;
+  listRecommendationsBatch(
+    request: ListRecommendationsBatchRequest,
+    metadata: Metadata,
+    callback: (error: ServiceError | null, response: ListRecommendationsBatchResponse) => void,
+  ): ClientUnaryCall;
+  listRecommendationsBatch(
+    request: ListRecommendationsBatchRequest,
+    metadata: Metadata,
+    options: Partial<CallOptions>,
+    callback: (error: ServiceError | null, response: ListRecommendationsBatchResponse) => void,
+  ): ClientUnaryCall;
+  /** Streaming variant for very large batches, one response per request in request order */
+  streamRecommendationsBatch(
+    request: ListRecommendationsBatchRequest,
+    options?: Partial<CallOptions>,
+  ): ClientReadableStream<ListRecommendationsResponse>;
+  streamRecommendationsBatch(
+    request: ListRecommendationsBatchRequest,
+    metadata?: Metadata,
+    options?: Partial<CallOptions>,
+  ): ClientReadableStream<ListRecommendationsResponse>;
 }
 
 export const RecommendationServiceClient = makeGenericClientConstructor(
@@ -0,0 +1,70 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""JSON log formatter throughput in records/sec.
+
+Formats the service's request log record with CustomJsonFormatter
+(python-json-logger) and FastJsonFormatter (orjson if installed, and the json
+module fallback), inside a recording span.
+
+    python benchmarks/bench_log_formatter.py [--records 100000]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from opentelemetry.sdk.trace import TracerProvider  # noqa: E402
+
+import logger as json_logger  # noqa: E402
+from logger import JSON_LOG_FORMAT, CustomJsonFormatter, FastJsonFormatter  # noqa: E402
+
+
+def make_record(i):
+    prod_list = ['OLJCESPC7Z', '66VCHSJNUP', '1YMWWN1N4O', 'L9ECAV7KIM', '2ZYFJ3GM2N']
+    return logging.LogRecord('main', logging.INFO, 'recommendation_server.py', 120,
+                             'Receive ListRecommendations for product ids:%s', (prod_list,), None)
+
+
+def records_per_sec(formatter, records):
+    start = time.perf_counter()
+    for record in records:
+        formatter.format(record)
+    return len(records) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--records', type=int, default=100000)
+    args = parser.parse_args()
+
+    tracer = TracerProvider().get_tracer('bench')
+    orjson = json_logger.orjson
+    formatters = [('python-json-logger', lambda: CustomJsonFormatter(JSON_LOG_FORMAT))]
+    if orjson is not None:
+        formatters.append(('fast (orjson)', lambda: FastJsonFormatter(JSON_LOG_FORMAT)))
+    formatters.append(('fast (json)', lambda: FastJsonFormatter(JSON_LOG_FORMAT)))
+
+    print(f"{'formatter':>20} {'records/s':>12} {'speedup':>8}")
+    baseline = None
+    with tracer.start_as_current_span('ListRecommendations'):
+        reference = json.loads(CustomJsonFormatter(JSON_LOG_FORMAT).format(make_record(0)))
+        for name, factory in formatters:
+            json_logger.orjson = orjson if 'orjson' in name else None
+            formatter = factory()
+            assert json.loads(formatter.format(make_record(0))).keys() == reference.keys()
+            rate = records_per_sec(formatter, [make_record(i) for i in range(args.records)])
+            baseline = baseline or rate
+            print(f"{name:>20} {rate:>12.0f} {rate / baseline:>7.1f}x")
+    json_logger.orjson = orjson
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Request product_ids decoding cost for large id lists.
+
+Compares the previous ''.join(...).split(',') with normalize_product_ids() for
+each request shape (repeated field, comma-joined, one value per character).
+The legacy decoding is only correct for the last two.
+
+    python benchmarks/bench_product_ids.py [--sizes 10,1000,100000]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import demo_pb2  # noqa: E402
+from product_ids import normalize_product_ids  # noqa: E402
+
+
+def legacy_decode(request_product_ids):
+    request_product_ids_str = ''.join(request_product_ids)
+    return request_product_ids_str.split(',')
+
+
+def per_call_us(fn):
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=3, number=number)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default='10,1000,100000', help='comma-separated id counts')
+    args = parser.parse_args()
+
+    print(f"{'ids':>8} {'form':>10} {'legacy us':>11} {'normalized us':>14} {'legacy correct':>15}")
+    for size in (int(x) for x in args.sizes.split(',')):
+        ids = [f"P{i:09d}" for i in range(size)]
+        joined = ','.join(ids)
+        forms = {
+            'repeated': ids,
+            'joined': [joined],
+            'chars': list(joined),
+        }
+        for form, values in forms.items():
+            # Decode from the protobuf repeated field, as the server does
+            field = demo_pb2.ListRecommendationsRequest(product_ids=values).product_ids
+            assert normalize_product_ids(field) == ids
+            legacy = per_call_us(lambda: legacy_decode(field))
+            normalized = per_call_us(lambda: normalize_product_ids(field))
+            correct = legacy_decode(field) == ids
+            print(f"{size:>8} {form:>10} {legacy:>11.1f} {normalized:>14.1f} {str(correct):>15}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Per-request recommendation sampling cost against catalog size.
+
+Compares the previous approach (set difference + random.sample over the whole
+filtered catalog) with ProductIndex rejection sampling.
+
+    python benchmarks/bench_product_index.py [--sizes 10,1000,1000000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from product_index import ProductIndex  # noqa: E402
+
+MAX_RESPONSES = 5
+
+
+def legacy_sample(product_ids, request_product_ids):
+    filtered_products = list(set(product_ids) - set(request_product_ids))
+    num_products = len(filtered_products)
+    num_return = min(MAX_RESPONSES, num_products)
+    indices = random.sample(range(num_products), num_return)
+    return [filtered_products[i] for i in indices]
+
+
+def indexed_sample(index, request_product_ids):
+    return index.sample(MAX_RESPONSES, index.present(request_product_ids))
+
+
+def per_call_us(fn):
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=3, number=number)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default='10,100,1000,10000,100000,1000000',
+                        help='comma-separated catalog sizes')
+    args = parser.parse_args()
+
+    print(f"{'catalog':>10} {'legacy us/req':>15} {'index us/req':>14} {'speedup':>9}")
+    for size in (int(x) for x in args.sizes.split(',')):
+        product_ids = [f"P{i:09d}" for i in range(size)]
+        request_ids = random.sample(product_ids, min(2, size))
+        index = ProductIndex(product_ids)
+
+        legacy = per_call_us(lambda: legacy_sample(product_ids, request_ids))
+        indexed = per_call_us(lambda: indexed_sample(index, request_ids))
+        print(f"{size:>10} {legacy:>15.2f} {indexed:>14.2f} {legacy / indexed:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
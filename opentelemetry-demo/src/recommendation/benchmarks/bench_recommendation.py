@@ -0,0 +1,229 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""In-process load harness for the recommendation service.
+
+Runs the threaded RecommendationService in this process without the demo
+stack:
+
+* product catalog: FakeCatalog with --products ids (10 to 1M) and
+  --catalog-latency-ms per ListProducts
+* flagd: an in-memory OpenFeature provider, flags set with --flag
+* OTLP collector: a local endpoint that drops every export, so the real OTLP
+  span, metric and log exporters run
+
+--clients concurrent grpc.aio clients call ListRecommendations for --duration
+seconds. Every --interval seconds the harness prints QPS, latency percentiles
+and RSS, then a summary with RSS growth. Turning on the cache leak flag shows
+up as steady RSS growth:
+
+    python benchmarks/bench_recommendation.py --flag recommendationCacheFailure=true
+
+The client shares the process (and the GIL) with the server, so absolute QPS
+is lower than against a separate server process; compare runs of this harness
+with each other.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import time
+
+import grpc
+import psutil
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from openfeature import api  # noqa: E402
+from openfeature.provider.in_memory_provider import InMemoryFlag, InMemoryProvider  # noqa: E402
+from opentelemetry.exporter.otlp.proto.grpc._log_exporter import OTLPLogExporter  # noqa: E402
+from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter  # noqa: E402
+from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter  # noqa: E402
+from opentelemetry.sdk._logs import LoggerProvider, LoggingHandler  # noqa: E402
+from opentelemetry.sdk._logs.export import BatchLogRecordProcessor  # noqa: E402
+from opentelemetry.sdk.metrics import MeterProvider  # noqa: E402
+from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader  # noqa: E402
+from opentelemetry.sdk.resources import Resource  # noqa: E402
+from opentelemetry.sdk.trace import TracerProvider  # noqa: E402
+from opentelemetry.sdk.trace.export import BatchSpanProcessor  # noqa: E402
+
+import demo_pb2  # noqa: E402
+import demo_pb2_grpc  # noqa: E402
+import recommendation_server as server  # noqa: E402
+from fake_services import MAX_MESSAGE_BYTES, start_catalog, start_collector  # noqa: E402
+from flags import FlagCache  # noqa: E402
+from metrics import init_metrics  # noqa: E402
+
+PERCENTILES = (0.5, 0.9, 0.99, 0.999)
+
+
+def parse_flags(values):
+    flags = {}
+    for value in values:
+        name, _, state = value.partition('=')
+        on = state.lower() in ('true', '1', 'on', 'yes')
+        flags[name] = InMemoryFlag('on' if on else 'off', {'on': True, 'off': False})
+    return flags
+
+
+def setup_service(catalog_port, collector_port, flags, flag_ttl):
+    """Build a RecommendationApp the way create_app() does, against the fakes."""
+    endpoint = f'127.0.0.1:{collector_port}'
+    resource = Resource.create({'service.name': 'recommendation-bench'})
+
+    tracer_provider = TracerProvider(resource=resource)
+    tracer_provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter(endpoint=endpoint, insecure=True)))
+    meter_provider = MeterProvider(resource=resource, metric_readers=[PeriodicExportingMetricReader(
+        OTLPMetricExporter(endpoint=endpoint, insecure=True), export_interval_millis=5000)])
+    logger_provider = LoggerProvider(resource=resource)
+    logger_provider.add_log_record_processor(BatchLogRecordProcessor(OTLPLogExporter(endpoint=endpoint, insecure=True)))
+
+    api.set_provider(InMemoryProvider(flags))
+
+    meter = meter_provider.get_meter('recommendation-bench')
+    rec_svc_metrics = init_metrics(meter)
+    flag_cache = FlagCache(ttl=flag_ttl, avoided_counter=rec_svc_metrics["app_flag_evaluations_avoided_counter"])
+    flag_cache.subscribe()
+
+    logger = logging.getLogger('main')
+    logger.addHandler(LoggingHandler(level=logging.NOTSET, logger_provider=logger_provider))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    os.environ.setdefault('PRODUCT_CATALOG_MAX_MESSAGE_BYTES', str(MAX_MESSAGE_BYTES))
+    # Popular products in memory only, no snapshot file is read or written
+    os.environ.setdefault('RECOMMENDATION_SNAPSHOT_DIR', '')
+    app = server.RecommendationApp(
+        tracer_provider.get_tracer('recommendation-bench'), meter, rec_svc_metrics,
+        flag_cache=flag_cache, popular_products=server.create_popular_products())
+    app.catalog_client = server.create_catalog_client(app, f'127.0.0.1:{catalog_port}')
+    grpc_server, port = server.create_threaded_server(app, 0)
+    grpc_server.start()
+    return app, grpc_server, port, (tracer_provider, meter_provider, logger_provider)
+
+
+def percentiles_ms(latencies):
+    if not latencies:
+        return {f'p{p * 100:g}': None for p in PERCENTILES}
+    latencies = sorted(latencies)
+    return {f'p{p * 100:g}': round(latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000, 3)
+            for p in PERCENTILES}
+
+
+async def drive(port, product_ids, args):
+    channels = [grpc.aio.insecure_channel(f'127.0.0.1:{port}') for _ in range(args.channels)]
+    stubs = [demo_pb2_grpc.RecommendationServiceStub(c) for c in channels]
+    process = psutil.Process()
+    window = []
+    totals = {'requests': 0, 'errors': 0, 'latencies': []}
+    samples = []
+    stop = time.monotonic() + args.duration
+
+    # Warm up: connections and the first catalog fetch
+    await stubs[0].ListRecommendations(demo_pb2.ListRecommendationsRequest(product_ids=product_ids[:1]))
+    rss_start = process.memory_info().rss
+
+    async def client(i):
+        stub = stubs[i % len(stubs)]
+        rng = random.Random(i)
+        while time.monotonic() < stop:
+            request = demo_pb2.ListRecommendationsRequest(
+                user_id=str(i), product_ids=rng.sample(product_ids, min(2, len(product_ids))))
+            start = time.perf_counter()
+            try:
+                await stub.ListRecommendations(request, timeout=args.timeout)
+                window.append(time.perf_counter() - start)
+            except grpc.aio.AioRpcError:
+                totals['errors'] += 1
+
+    async def sampler():
+        started = last = time.monotonic()
+        while last < stop:
+            await asyncio.sleep(min(args.interval, max(0.0, stop - last)))
+            now = time.monotonic()
+            latencies = window[:]
+            del window[:len(latencies)]
+            totals['requests'] += len(latencies)
+            totals['latencies'].extend(latencies)
+            rss = process.memory_info().rss
+            sample = {
+                't': round(now - started, 1),
+                'qps': round(len(latencies) / (now - last), 1),
+                **percentiles_ms(latencies),
+                'rss_mb': round(rss / 2 ** 20, 1),
+                'rss_growth_mb': round((rss - rss_start) / 2 ** 20, 1),
+            }
+            samples.append(sample)
+            print(f"{sample['t']:>7} {sample['qps']:>9} {sample['p50'] or 0:>8} {sample['p99'] or 0:>8} "
+                  f"{sample['rss_mb']:>9} {sample['rss_growth_mb']:>8}", flush=True)
+            last = now
+
+    print(f"{'t (s)':>7} {'qps':>9} {'p50 ms':>8} {'p99 ms':>8} {'rss MB':>9} {'growth':>8}")
+    started = time.monotonic()
+    await asyncio.gather(sampler(), *(client(i) for i in range(args.clients)))
+    elapsed = time.monotonic() - started
+    for c in channels:
+        await c.close()
+
+    rss_end = process.memory_info().rss
+    return {
+        'requests': totals['requests'],
+        'errors': totals['errors'],
+        'qps': round(totals['requests'] / elapsed, 1),
+        'latency_ms': percentiles_ms(totals['latencies']),
+        'rss_start_mb': round(rss_start / 2 ** 20, 1),
+        'rss_end_mb': round(rss_end / 2 ** 20, 1),
+        'rss_growth_mb_per_min': round((rss_end - rss_start) / 2 ** 20 / elapsed * 60, 2),
+        'samples': samples,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--products', type=int, default=1000, help='fake catalog size (10 to 1000000)')
+    parser.add_argument('--catalog-latency-ms', type=float, default=0.0, help='latency of each ListProducts')
+    parser.add_argument('--clients', type=int, default=50, help='concurrent client tasks')
+    parser.add_argument('--channels', type=int, default=4, help='client channels (HTTP/2 connections)')
+    parser.add_argument('--duration', type=float, default=30.0, help='seconds of load')
+    parser.add_argument('--interval', type=float, default=5.0, help='seconds between samples')
+    parser.add_argument('--timeout', type=float, default=10.0, help='client deadline per call')
+    parser.add_argument('--flag', action='append', default=[], metavar='NAME=true|false',
+                        help='feature flag served by the in-memory provider, repeatable')
+    parser.add_argument('--flag-ttl', type=float, default=5.0, help='FlagCache TTL in seconds')
+    parser.add_argument('--json', help='also write the results to this file')
+    args = parser.parse_args()
+
+    catalog, catalog_server, catalog_port = start_catalog(args.products, args.catalog_latency_ms / 1000)
+    collector, collector_server, collector_port = start_collector()
+    app, grpc_server, port, providers = setup_service(catalog_port, collector_port, parse_flags(args.flag), args.flag_ttl)
+
+    try:
+        results = asyncio.run(drive(port, catalog.ids(), args))
+    finally:
+        grpc_server.stop(grace=2).wait()
+        app.catalog_cache.stop()
+        for provider in providers:
+            provider.shutdown()
+        catalog_server.stop(None)
+        collector_server.stop(None)
+
+    results.update(products=args.products, clients=args.clients, flags=args.flag,
+                   catalog_list_calls=catalog.list_calls, otlp_exports=collector.exports)
+    print(f"\n{results['requests']} requests, {results['errors']} errors, {results['qps']} QPS")
+    print('latency ms: ' + ', '.join(f'{k}={v}' for k, v in results['latency_ms'].items()))
+    print(f"RSS {results['rss_start_mb']} -> {results['rss_end_mb']} MB "
+          f"({results['rss_growth_mb_per_min']} MB/min), "
+          f"{results['catalog_list_calls']} ListProducts calls, OTLP exports {results['otlp_exports']}")
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
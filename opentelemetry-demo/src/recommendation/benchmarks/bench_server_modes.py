@@ -0,0 +1,141 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Load test of the threaded and async (grpc.aio) recommendation server modes.
+
+Starts an in-process fake ProductCatalogService, then for each mode spawns
+recommendation_server.py and drives ListRecommendations from N concurrent
+grpc.aio clients for a fixed duration. flagd is pointed at an unreachable
+address so flag lookups return their defaults.
+
+    python benchmarks/bench_server_modes.py [--clients 100,1000] [--duration 10]
+
+--instrument runs the server under opentelemetry-instrument, with the
+OpenTelemetry gRPC server interceptor in front of the service as in the
+container image.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import shutil
+import subprocess
+import sys
+import time
+
+import grpc
+from grpc_health.v1 import health_pb2, health_pb2_grpc
+
+HERE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, HERE)
+
+import demo_pb2  # noqa: E402
+import demo_pb2_grpc  # noqa: E402
+from fake_services import free_port, start_catalog  # noqa: E402
+
+
+def start_server(mode, port, catalog_port, args):
+    env = dict(os.environ,
+               OTEL_SERVICE_NAME='recommendation-bench',
+               OTEL_TRACES_EXPORTER='none', OTEL_METRICS_EXPORTER='none', OTEL_LOGS_EXPORTER='none',
+               PRODUCT_CATALOG_ADDR=f'127.0.0.1:{catalog_port}',
+               RECOMMENDATION_PORT=str(port),
+               RECOMMENDATION_SERVER_MODE=mode,
+               RECOMMENDATION_MAX_WORKERS=str(args.max_workers),
+               PRODUCT_CATALOG_MAX_MESSAGE_BYTES=str(512 * 1024 * 1024),
+               FLAGD_HOST='127.0.0.1', FLAGD_PORT=str(free_port()))
+    if args.max_concurrent_streams:
+        env['RECOMMENDATION_MAX_CONCURRENT_STREAMS'] = str(args.max_concurrent_streams)
+    command = [sys.executable, os.path.join(HERE, 'recommendation_server.py')]
+    if args.instrument:
+        env['OTEL_PYTHON_GRPC_EXCLUDED_SERVICES'] = 'grpc.health.v1.Health'
+        command.insert(0, shutil.which('opentelemetry-instrument', path=os.path.dirname(sys.executable))
+                       or 'opentelemetry-instrument')
+    proc = subprocess.Popen(command,
+                            env=env, cwd=HERE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    with grpc.insecure_channel(f'127.0.0.1:{port}') as channel:
+        grpc.channel_ready_future(channel).result(timeout=30)
+        health_pb2_grpc.HealthStub(channel).Check(health_pb2.HealthCheckRequest(), timeout=5)
+    return proc
+
+
+async def drive(port, clients, duration, channels, product_ids):
+    chans = [grpc.aio.insecure_channel(f'127.0.0.1:{port}') for _ in range(channels)]
+    stubs = [demo_pb2_grpc.RecommendationServiceStub(c) for c in chans]
+    latencies = []
+    rejections = []
+    errors = 0
+    deadline = time.monotonic() + duration
+
+    async def client(i):
+        nonlocal errors
+        stub = stubs[i % len(stubs)]
+        rng = random.Random(i)
+        while time.monotonic() < deadline:
+            request = demo_pb2.ListRecommendationsRequest(product_ids=rng.sample(product_ids, 2))
+            start = time.perf_counter()
+            try:
+                await stub.ListRecommendations(request, timeout=10)
+                latencies.append(time.perf_counter() - start)
+            except grpc.aio.AioRpcError as e:
+                if e.code() == grpc.StatusCode.RESOURCE_EXHAUSTED:
+                    rejections.append(time.perf_counter() - start)
+                else:
+                    errors += 1
+
+    # Warm up the connections and the server's catalog cache
+    await asyncio.gather(*(s.ListRecommendations(
+        demo_pb2.ListRecommendationsRequest(product_ids=product_ids[:1])) for s in stubs))
+    started = time.monotonic()
+    await asyncio.gather(*(client(i) for i in range(clients)))
+    elapsed = time.monotonic() - started
+    for c in chans:
+        await c.close()
+    return latencies, rejections, errors, elapsed
+
+
+def percentile(values, p):
+    return values[min(len(values) - 1, int(len(values) * p))] * 1000 if values else float('nan')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--modes', default='threaded,async')
+    parser.add_argument('--clients', default='100,1000', help='comma-separated concurrent client counts')
+    parser.add_argument('--duration', type=float, default=10.0, help='seconds per run')
+    parser.add_argument('--products', type=int, default=1000, help='fake catalog size')
+    parser.add_argument('--catalog-latency-ms', type=float, default=0.0)
+    parser.add_argument('--channels', type=int, default=8, help='client channels (HTTP/2 connections)')
+    parser.add_argument('--max-workers', type=int, default=10, help='threaded mode pool size')
+    parser.add_argument('--max-concurrent-streams', type=int, default=0)
+    parser.add_argument('--instrument', action='store_true', help='run the server under opentelemetry-instrument')
+    args = parser.parse_args()
+
+    catalog_servicer, catalog, catalog_port = start_catalog(args.products, args.catalog_latency_ms / 1000)
+    product_ids = catalog_servicer.ids()
+
+    print(f"{'mode':>9} {'clients':>8} {'qps':>9} {'p50 ms':>8} {'p99 ms':>8} "
+          f"{'rejected':>9} {'rej p50':>8} {'rej p99':>8} {'errors':>7}")
+    for mode in args.modes.split(','):
+        for clients in (int(x) for x in args.clients.split(',')):
+            port = free_port()
+            proc = start_server(mode, port, catalog_port, args)
+            try:
+                latencies, rejections, errors, elapsed = asyncio.run(
+                    drive(port, clients, args.duration, args.channels, product_ids))
+            finally:
+                proc.terminate()
+                proc.wait()
+            latencies.sort()
+            rejections.sort()
+            print(f"{mode:>9} {clients:>8} {len(latencies) / elapsed:>9.0f} "
+                  f"{percentile(latencies, 0.50):>8.2f} {percentile(latencies, 0.99):>8.2f} "
+                  f"{len(rejections):>9} {percentile(rejections, 0.50):>8.2f} {percentile(rejections, 0.99):>8.2f} {errors:>7}")
+    catalog.stop(None)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Cold start time of recommendation_server.py against its start-up budget.
+
+Starts an in-process fake ProductCatalogService, then spawns the server
+--runs times (under opentelemetry-instrument when it is installed, as in the
+container image) and measures from spawn until the port accepts connections
+and until the health Check reports SERVING, i.e. the catalog cache is warm.
+flagd is pointed at an unreachable address.
+
+    python benchmarks/bench_startup.py [--runs 10] [--catalog-latency-ms 200] [--budget-ms 5000]
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+
+import grpc
+from grpc_health.v1 import health_pb2, health_pb2_grpc
+
+HERE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, HERE)
+
+from fake_services import free_port, start_catalog  # noqa: E402
+
+
+def cold_start(catalog_port, args):
+    port = free_port()
+    env = dict(os.environ,
+               OTEL_SERVICE_NAME='recommendation-bench',
+               OTEL_TRACES_EXPORTER='none', OTEL_METRICS_EXPORTER='none', OTEL_LOGS_EXPORTER='none',
+               PRODUCT_CATALOG_ADDR=f'127.0.0.1:{catalog_port}',
+               RECOMMENDATION_PORT=str(port),
+               RECOMMENDATION_SERVER_MODE=args.mode,
+               RECOMMENDATION_STARTUP_BUDGET_MS=str(args.budget_ms),
+               FLAGD_HOST='127.0.0.1', FLAGD_PORT=str(free_port()))
+    command = [sys.executable, os.path.join(HERE, 'recommendation_server.py')]
+    instrument = shutil.which('opentelemetry-instrument', path=os.path.dirname(sys.executable))
+    if instrument and not args.no_instrument:
+        command.insert(0, instrument)
+
+    started = time.monotonic()
+    proc = subprocess.Popen(command, env=env, cwd=HERE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        # Reconnect quickly while the server is not listening yet
+        options = [('grpc.initial_reconnect_backoff_ms', 5), ('grpc.min_reconnect_backoff_ms', 5),
+                   ('grpc.max_reconnect_backoff_ms', 5)]
+        with grpc.insecure_channel(f'127.0.0.1:{port}', options=options) as channel:
+            health = health_pb2_grpc.HealthStub(channel)
+            listening = None
+            while True:
+                try:
+                    status = health.Check(health_pb2.HealthCheckRequest(), timeout=30, wait_for_ready=True).status
+                except grpc.RpcError:
+                    continue
+                listening = listening or time.monotonic() - started
+                if status == health_pb2.HealthCheckResponse.SERVING:
+                    return listening, time.monotonic() - started
+                time.sleep(0.005)
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--mode', default='threaded', help='threaded or async')
+    parser.add_argument('--products', type=int, default=1000, help='fake catalog size')
+    parser.add_argument('--catalog-latency-ms', type=float, default=0.0)
+    parser.add_argument('--budget-ms', type=float, default=5000)
+    parser.add_argument('--no-instrument', action='store_true', help='run without opentelemetry-instrument')
+    args = parser.parse_args()
+
+    _, catalog, catalog_port = start_catalog(args.products, args.catalog_latency_ms / 1000)
+    listening, ready = [], []
+    for _ in range(args.runs):
+        up, serving = cold_start(catalog_port, args)
+        listening.append(up * 1000)
+        ready.append(serving * 1000)
+    catalog.stop(None)
+
+    print(f"{'phase':>10} {'median ms':>10} {'max ms':>8}")
+    for name, values in (('listening', listening), ('serving', ready)):
+        print(f"{name:>10} {statistics.median(values):>10.0f} {max(values):>8.0f}")
+    over = sum(1 for value in ready if value > args.budget_ms)
+    print(f"{over}/{args.runs} runs over the {args.budget_ms:.0f} ms budget")
+
+
+if __name__ == '__main__':
+    main()
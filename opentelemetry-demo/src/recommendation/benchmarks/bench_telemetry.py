@@ -0,0 +1,100 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Per-request telemetry overhead of ListRecommendations.
+
+Runs get_product_list() + build_response() in-process against a cached fake
+catalog for each TELEMETRY_VERBOSITY, with spans sampled in and sampled out.
+Spans go through a BatchSpanProcessor to an exporter that drops them, request
+logs through a formatter to /dev/null.
+
+    python benchmarks/bench_telemetry.py [--products 1000] [--requests 20000]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from opentelemetry.sdk.metrics import MeterProvider  # noqa: E402
+from opentelemetry.sdk.trace import TracerProvider  # noqa: E402
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, SpanExporter, SpanExportResult  # noqa: E402
+from opentelemetry.sdk.trace.sampling import ALWAYS_OFF, ALWAYS_ON  # noqa: E402
+
+import demo_pb2  # noqa: E402
+import recommendation_server as server  # noqa: E402
+from catalog_cache import CatalogCache  # noqa: E402
+from metrics import init_metrics  # noqa: E402
+from popular import PopularProducts  # noqa: E402
+from product_index import ProductIndex  # noqa: E402
+from telemetry import BASIC, FULL, OFF, TelemetryPolicy  # noqa: E402
+
+CATEGORIES = ['accessories', 'telescopes', 'binoculars', 'flashlights', 'books', 'assembly', 'travel']
+
+
+class DropExporter(SpanExporter):
+    def export(self, spans):
+        return SpanExportResult.SUCCESS
+
+
+class StaticFlags:
+    def get_boolean(self, flag_name, default=False):
+        return default
+
+
+def setup(products):
+    catalog = [demo_pb2.Product(id=f"P{i:09d}", categories=[CATEGORIES[i % len(CATEGORIES)]])
+               for i in range(products)]
+    catalog_cache = CatalogCache(fetch=lambda: catalog, build=ProductIndex.from_products, ttl=3600)
+    catalog_cache.refresh()
+
+    logger = logging.getLogger('main')
+    handler = logging.StreamHandler(open(os.devnull, 'w'))
+    handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s [%(name)s] - %(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return catalog_cache, [p.id for p in catalog]
+
+
+def run(catalog_cache, product_ids, verbosity, sampler, requests):
+    provider = TracerProvider(sampler=sampler)
+    provider.add_span_processor(BatchSpanProcessor(DropExporter()))
+    tracer = provider.get_tracer('bench')
+    meter = MeterProvider().get_meter('bench')
+    app = server.RecommendationApp(tracer, meter, init_metrics(meter), flag_cache=StaticFlags(),
+                                   popular_products=PopularProducts(size=20, path=None),
+                                   telemetry=TelemetryPolicy(verbosity))
+    app.catalog_cache = catalog_cache
+
+    request = demo_pb2.ListRecommendationsRequest(product_ids=product_ids[:2]).product_ids
+    start = time.perf_counter()
+    for _ in range(requests):
+        with tracer.start_as_current_span("/oteldemo.RecommendationService/ListRecommendations"):
+            app.build_response(app.get_product_list(request))
+    elapsed = time.perf_counter() - start
+    provider.shutdown()
+    return elapsed / requests * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--products', type=int, default=1000)
+    parser.add_argument('--requests', type=int, default=20000)
+    args = parser.parse_args()
+
+    catalog_cache, product_ids = setup(args.products)
+    print(f"{'verbosity':>10} {'sampled':>8} {'us/request':>11}")
+    for sampler, sampled in ((ALWAYS_ON, 'yes'), (ALWAYS_OFF, 'no')):
+        for verbosity in (FULL, BASIC, OFF):
+            us = run(catalog_cache, product_ids, verbosity, sampler, args.requests)
+            print(f"{verbosity:>10} {sampled:>8} {us:>11.1f}")
+
+
+if __name__ == '__main__':
+    main()
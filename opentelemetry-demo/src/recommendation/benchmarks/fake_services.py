@@ -0,0 +1,94 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""In-process stand-ins for the services the recommendation service talks to.
+
+* FakeCatalog: ProductCatalogService with a configurable number of products
+  and ListProducts latency
+* FakeCollector: OTLP trace, metrics and logs endpoint that accepts and drops
+  every export, so the real OTLP exporters (and their serialization) run
+"""
+
+import socket
+import time
+from concurrent import futures
+
+import grpc
+from opentelemetry.proto.collector.logs.v1 import logs_service_pb2, logs_service_pb2_grpc
+from opentelemetry.proto.collector.metrics.v1 import metrics_service_pb2, metrics_service_pb2_grpc
+from opentelemetry.proto.collector.trace.v1 import trace_service_pb2, trace_service_pb2_grpc
+
+import demo_pb2
+import demo_pb2_grpc
+
+CATEGORIES = ['accessories', 'telescopes', 'binoculars', 'flashlights', 'books', 'assembly', 'travel']
+
+MAX_MESSAGE_BYTES = 512 * 1024 * 1024
+
+
+class FakeCatalog(demo_pb2_grpc.ProductCatalogServiceServicer):
+    def __init__(self, size, latency):
+        self.latency = latency
+        self.response = demo_pb2.ListProductsResponse(products=[
+            demo_pb2.Product(id=f"P{i:09d}", categories=[CATEGORIES[i % len(CATEGORIES)]])
+            for i in range(size)
+        ])
+        self.list_calls = 0
+
+    def ids(self):
+        return [p.id for p in self.response.products]
+
+    def ListProducts(self, request, context):
+        self.list_calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return self.response
+
+
+class FakeCollector(trace_service_pb2_grpc.TraceServiceServicer,
+                    metrics_service_pb2_grpc.MetricsServiceServicer,
+                    logs_service_pb2_grpc.LogsServiceServicer):
+    def __init__(self):
+        self.exports = {'traces': 0, 'metrics': 0, 'logs': 0}
+
+    def Export(self, request, context):
+        if isinstance(request, trace_service_pb2.ExportTraceServiceRequest):
+            self.exports['traces'] += 1
+            return trace_service_pb2.ExportTraceServiceResponse()
+        if isinstance(request, metrics_service_pb2.ExportMetricsServiceRequest):
+            self.exports['metrics'] += 1
+            return metrics_service_pb2.ExportMetricsServiceResponse()
+        self.exports['logs'] += 1
+        return logs_service_pb2.ExportLogsServiceResponse()
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_catalog(size, latency=0.0):
+    """Serve a FakeCatalog on a local port; returns (servicer, server, port)."""
+    servicer = FakeCatalog(size, latency)
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4),
+                         options=[('grpc.max_send_message_length', MAX_MESSAGE_BYTES)])
+    demo_pb2_grpc.add_ProductCatalogServiceServicer_to_server(servicer, server)
+    port = server.add_insecure_port('127.0.0.1:0')
+    server.start()
+    return servicer, server, port
+
+
+def start_collector():
+    """Serve a FakeCollector on a local port; returns (servicer, server, port)."""
+    servicer = FakeCollector()
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=2),
+                         options=[('grpc.max_receive_message_length', MAX_MESSAGE_BYTES)])
+    trace_service_pb2_grpc.add_TraceServiceServicer_to_server(servicer, server)
+    metrics_service_pb2_grpc.add_MetricsServiceServicer_to_server(servicer, server)
+    logs_service_pb2_grpc.add_LogsServiceServicer_to_server(servicer, server)
+    port = server.add_insecure_port('127.0.0.1:0')
+    server.start()
+    return servicer, server, port
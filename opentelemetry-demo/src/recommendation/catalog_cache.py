@@ -0,0 +1,228 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""TTL-bounded product catalog cache with stale-while-revalidate.
+
+A snapshot is served fresh for ``ttl`` seconds. After that it is still served
+for up to ``max_stale`` more seconds while a refresh runs in the background;
+only once it is older than ``ttl + max_stale`` (or before the first fetch) do
+callers block on the catalog. At most one refresh is in flight at a time and
+every worker thread that needs it waits on the same call.
+
+A cache can be seeded with a value persisted by a previous process, with the
+age it had then; one older than ``ttl + max_stale`` is not used.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Future
+
+logger = logging.getLogger('main')
+
+HIT = 'hit'
+STALE = 'stale'
+MISS = 'miss'
+
+
+class CatalogSnapshot:
+    __slots__ = ('value', 'size', 'fetched_at', 'version')
+
+    def __init__(self, value, size, fetched_at, version):
+        self.value = value
+        self.size = size
+        self.fetched_at = fetched_at
+        self.version = version
+
+
+class CatalogCache:
+    def __init__(self, fetch, build=lambda products, previous: tuple(products), ttl=60.0,
+                 max_stale=300.0, max_products=100_000, refresh_interval=None, on_change=None,
+                 on_revalidate=None, clock=time.monotonic):
+        """
+        fetch: callable returning the catalog's products (e.g. ListProducts().products)
+        build: build(products, previous_value) turns the fetched products into the
+               cached value; returning previous_value unchanged keeps the version
+        max_products: size bound; products beyond it are dropped from the snapshot
+        refresh_interval: period of the background refresh thread (default ttl / 2)
+        on_change: on_change(snapshot) is called on the refreshing thread after
+                   every refresh that produces a new version
+        on_revalidate: likewise, after every refresh that keeps the version
+        """
+        self._fetch = fetch
+        self._build = build
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.max_products = max_products
+        self.refresh_interval = refresh_interval if refresh_interval is not None else ttl / 2
+        self._on_change = on_change
+        self._on_revalidate = on_revalidate
+        self._clock = clock
+
+        self._snapshot = None
+        self._inflight = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self.stats = {HIT: 0, STALE: 0, MISS: 0, 'refreshes': 0, 'refresh_errors': 0, 'truncated': 0}
+
+    @property
+    def snapshot(self):
+        return self._snapshot
+
+    @property
+    def warm(self):
+        """True once a first snapshot has been fetched."""
+        return self._snapshot is not None
+
+    def age(self):
+        snapshot = self._snapshot
+        return None if snapshot is None else self._clock() - snapshot.fetched_at
+
+    def seed(self, value, size, age):
+        """Serve ``value``, fetched ``age`` seconds ago, until the first refresh.
+
+        Returns False, leaving the cache cold, when the cache is already warm
+        or ``value`` is too old to be served.
+        """
+        if age >= self.ttl + self.max_stale:
+            return False
+        with self._lock:
+            if self._snapshot is None:
+                self._snapshot = CatalogSnapshot(value, size, self._clock() - max(age, 0.0), 1)
+                return True
+            return False
+
+    def get(self):
+        return self.get_with_state()[0]
+
+    def get_with_state(self, timeout=None):
+        """Return (snapshot, state) where state is one of 'hit', 'stale' or 'miss'.
+
+        On a miss, waits at most ``timeout`` seconds for the catalog (raising
+        TimeoutError after that, the refresh carries on in the background).
+        """
+        snapshot = self._snapshot
+        if snapshot is not None:
+            age = self._clock() - snapshot.fetched_at
+            if age < self.ttl:
+                self.stats[HIT] += 1
+                return snapshot, HIT
+            if age < self.ttl + self.max_stale:
+                self.stats[STALE] += 1
+                self.refresh_async()
+                return snapshot, STALE
+        self.stats[MISS] += 1
+        if timeout is not None:
+            return self.refresh_async().result(timeout), MISS
+        return self.refresh(), MISS
+
+    async def aget_with_state(self, timeout=None):
+        """get_with_state() for asyncio callers: a miss awaits the refresh instead of blocking."""
+        snapshot = self._snapshot
+        if snapshot is not None:
+            age = self._clock() - snapshot.fetched_at
+            if age < self.ttl:
+                self.stats[HIT] += 1
+                return snapshot, HIT
+            if age < self.ttl + self.max_stale:
+                self.stats[STALE] += 1
+                self.refresh_async()
+                return snapshot, STALE
+        self.stats[MISS] += 1
+        # Shielded, a timeout must not cancel the refresh other callers share
+        return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(self.refresh_async())), timeout), MISS
+
+    def refresh(self, timeout=None):
+        """Refresh now, or wait for the refresh already in flight, and return the new snapshot."""
+        future, owner = self._claim_refresh()
+        if owner:
+            self._run_refresh(future)
+        return future.result(timeout)
+
+    def refresh_async(self):
+        future, owner = self._claim_refresh()
+        if owner:
+            threading.Thread(target=self._run_refresh, args=(future,),
+                             name='catalog-cache-refresh', daemon=True).start()
+        return future
+
+    def _claim_refresh(self):
+        with self._lock:
+            if self._inflight is not None:
+                return self._inflight, False
+            self._inflight = Future()
+            return self._inflight, True
+
+    def _run_refresh(self, future):
+        try:
+            products = self._fetch()
+            if len(products) > self.max_products:
+                self.stats['truncated'] += 1
+                logger.warning("catalog cache: %d products exceed the %d bound, truncating",
+                               len(products), self.max_products)
+                products = products[:self.max_products]
+            previous = self._snapshot
+            previous_value = previous.value if previous is not None else None
+            value = self._build(products, previous_value)
+            if previous is None:
+                version = 1
+            else:
+                version = previous.version if value is previous_value else previous.version + 1
+            snapshot = CatalogSnapshot(value, len(products), self._clock(), version)
+            self._snapshot = snapshot
+            self.stats['refreshes'] += 1
+            future.set_result(snapshot)
+        except BaseException as e:
+            self.stats['refresh_errors'] += 1
+            future.set_exception(e)
+            return
+        finally:
+            with self._lock:
+                self._inflight = None
+        # After the waiters are released
+        changed = previous is None or snapshot.version != previous.version
+        callback = self._on_change if changed else self._on_revalidate
+        if callback is not None:
+            try:
+                callback(snapshot)
+            except Exception as e:
+                logger.warning("catalog cache: %s callback failed: %s", 'change' if changed else 'revalidate', e)
+
+    def start(self):
+        """Start the background refresh thread (idempotent)."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._refresh_loop, name='catalog-cache', daemon=True)
+            self._thread.start()
+
+    def warm_up(self, on_ready=None, retry_interval=1.0):
+        """Fetch the first snapshot on a background thread, retrying every
+        ``retry_interval`` seconds until it succeeds, then call ``on_ready()``."""
+
+        def warm():
+            while not self._stop.is_set():
+                try:
+                    self.refresh()
+                    break
+                except Exception as e:
+                    logger.warning("catalog cache: warm-up failed, retrying: %s", e)
+                    self._stop.wait(retry_interval)
+            else:
+                return
+            if on_ready is not None:
+                on_ready()
+
+        threading.Thread(target=warm, name='catalog-cache-warm-up', daemon=True).start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _refresh_loop(self):
+        while not self._stop.wait(self.refresh_interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.warning("catalog cache: background refresh failed: %s", e)
@@ -0,0 +1,234 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Product catalog client: a round-robin pool of channels with deadlines.
+
+Every channel keeps its own HTTP/2 connection (local subchannel pool) with
+keepalive pings. All catalog RPCs are idempotent reads, so they are either:
+
+* retried by gRPC on UNAVAILABLE through the channel's service config, with
+  retry throttling so an unavailable catalog does not get a retry storm, or
+* hedged: if an attempt has not answered after ``hedging_delay`` seconds
+  another one is sent on the next channel of the pool, the first successful
+  response wins and the others are cancelled. Attempts failing with
+  UNAVAILABLE are replaced by the hedging loop itself, so hedged channels
+  carry no retry policy; gRPC core ignores ``hedgingPolicy`` in service
+  configs, hence the client-side implementation.
+
+Every attempt carries what is left of the call's deadline. In-flight attempts
+are reported per channel through an UpDownCounter.
+"""
+
+import asyncio
+import itertools
+import json
+import queue
+import threading
+import time
+
+import grpc
+
+import demo_pb2
+import demo_pb2_grpc
+
+SERVICE = 'oteldemo.ProductCatalogService'
+
+COMPRESSION = {
+    'none': grpc.Compression.NoCompression,
+    'deflate': grpc.Compression.Deflate,
+    'gzip': grpc.Compression.Gzip,
+}
+
+# Status codes after which a hedged attempt may be replaced right away
+NON_FATAL_CODES = (grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.RESOURCE_EXHAUSTED)
+
+
+class CatalogClient:
+    def __init__(self, addr, channels=2, timeout=5.0, max_attempts=3, hedging_delay=None,
+                 keepalive_time_ms=300000, keepalive_timeout_ms=20000, compression='none',
+                 max_message_bytes=4 * 1024 * 1024, in_flight_counter=None, aio=False):
+        """
+        timeout: deadline in seconds for a whole call, hedged attempts included
+        max_attempts: gRPC retry attempts per call, or hedged attempts per call with hedging
+        hedging_delay: seconds before a hedged attempt is sent, None disables hedging
+        keepalive_time_ms: keepalive ping interval; gRPC Go servers reject pings more
+                           frequent than every 5 minutes by default
+        compression: 'none', 'deflate' or 'gzip' for requests sent by this client
+        max_message_bytes: largest response accepted, ListProducts of big catalogs exceeds
+                           gRPC's 4 MiB default
+        in_flight_counter: optional OpenTelemetry UpDownCounter of in-flight attempts
+        aio: build grpc.aio channels and use the coroutine methods
+        """
+        self.addr = addr
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        self.hedging_delay = hedging_delay
+        self.compression = COMPRESSION[compression]
+        self._in_flight_counter = in_flight_counter
+        self._in_flight = [0] * channels
+        self._lock = threading.Lock()
+        self._next = itertools.count()
+
+        options = [
+            ('grpc.use_local_subchannel_pool', 1),
+            ('grpc.keepalive_time_ms', keepalive_time_ms),
+            ('grpc.keepalive_timeout_ms', keepalive_timeout_ms),
+            ('grpc.keepalive_permit_without_calls', 0),
+            ('grpc.enable_retries', 1),
+            ('grpc.max_receive_message_length', max_message_bytes),
+            ('grpc.service_config', json.dumps(self.service_config())),
+        ]
+        insecure_channel = grpc.aio.insecure_channel if aio else grpc.insecure_channel
+        self._channels = [
+            insecure_channel(addr, options=options, compression=self.compression)
+            for _ in range(channels)
+        ]
+        self._stubs = [demo_pb2_grpc.ProductCatalogServiceStub(c) for c in self._channels]
+
+    def service_config(self):
+        method_config = {'name': [{'service': SERVICE}]}
+        # Hedged calls already re-attempt on UNAVAILABLE up to max_attempts, a retry
+        # policy on every attempt would multiply them
+        if self.hedging_delay is None:
+            method_config['retryPolicy'] = {
+                'maxAttempts': max(2, self.max_attempts),
+                'initialBackoff': '0.1s',
+                'maxBackoff': '1s',
+                'backoffMultiplier': 2,
+                'retryableStatusCodes': ['UNAVAILABLE'],
+            }
+        return {
+            'methodConfig': [method_config],
+            # Each failure costs a token and each success gives back 0.1, retries
+            # pause while fewer than half the tokens are left
+            'retryThrottling': {'maxTokens': 10, 'tokenRatio': 0.1},
+        }
+
+    def in_flight(self):
+        return list(self._in_flight)
+
+    def _pick(self):
+        return next(self._next) % len(self._stubs)
+
+    def _started(self, channel):
+        with self._lock:
+            self._in_flight[channel] += 1
+        if self._in_flight_counter is not None:
+            self._in_flight_counter.add(1, {'rpc.channel': channel})
+
+    def _finished(self, channel):
+        with self._lock:
+            self._in_flight[channel] -= 1
+        if self._in_flight_counter is not None:
+            self._in_flight_counter.add(-1, {'rpc.channel': channel})
+
+    def list_products(self):
+        return self.call('ListProducts', demo_pb2.Empty()).products
+
+    async def alist_products(self):
+        return (await self.acall('ListProducts', demo_pb2.Empty())).products
+
+    def call(self, method, request):
+        """Blocking call of an idempotent ProductCatalogService method."""
+        deadline = time.monotonic() + self.timeout
+        if self.hedging_delay is None:
+            channel = self._pick()
+            self._started(channel)
+            try:
+                return getattr(self._stubs[channel], method)(request, timeout=self.timeout)
+            finally:
+                self._finished(channel)
+        return self._hedged_call(method, request, deadline)
+
+    def _hedged_call(self, method, request, deadline):
+        done = queue.Queue()
+        attempts = []
+
+        def start():
+            channel = self._pick()
+            self._started(channel)
+            future = getattr(self._stubs[channel], method).future(
+                request, timeout=max(0.0, deadline - time.monotonic()))
+            attempts.append(future)
+
+            def on_done(f):
+                self._finished(channel)
+                done.put(f)
+            future.add_done_callback(on_done)
+
+        start()
+        pending = 1
+        error = None
+        try:
+            while pending:
+                remaining = deadline - time.monotonic()
+                if len(attempts) < self.max_attempts and remaining > 0:
+                    wait = min(remaining, self.hedging_delay)
+                else:
+                    # No more hedges, the attempts in flight end by the deadline
+                    wait = None
+                try:
+                    future = done.get(timeout=wait)
+                except queue.Empty:
+                    start()
+                    pending += 1
+                    continue
+                pending -= 1
+                if future.code() == grpc.StatusCode.OK:
+                    return future.result()
+                error = future.exception()
+                if future.code() not in NON_FATAL_CODES:
+                    break
+                if len(attempts) < self.max_attempts and time.monotonic() < deadline:
+                    start()
+                    pending += 1
+            raise error
+        finally:
+            for future in attempts:
+                future.cancel()
+
+    async def acall(self, method, request):
+        """Coroutine call of an idempotent ProductCatalogService method (aio channels)."""
+        deadline = time.monotonic() + self.timeout
+        tasks = set()
+
+        def start():
+            channel = self._pick()
+            self._started(channel)
+            task = asyncio.ensure_future(getattr(self._stubs[channel], method)(
+                request, timeout=max(0.0, deadline - time.monotonic())))
+            task.add_done_callback(lambda _: self._finished(channel))
+            tasks.add(task)
+
+        start()
+        attempts = 1
+        pending = set(tasks)
+        error = None
+        try:
+            while pending:
+                remaining = deadline - time.monotonic()
+                hedge = self.hedging_delay is not None and attempts < self.max_attempts and remaining > 0
+                finished, pending = await asyncio.wait(
+                    pending, timeout=min(remaining, self.hedging_delay) if hedge else None,
+                    return_when=asyncio.FIRST_COMPLETED)
+                if not finished:
+                    start()
+                    attempts += 1
+                    pending = {t for t in tasks if not t.done()}
+                    continue
+                for task in finished:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+                if not isinstance(error, grpc.aio.AioRpcError) or error.code() not in NON_FATAL_CODES:
+                    break
+                if hedge:
+                    start()
+                    attempts += 1
+                    pending = {t for t in tasks if not t.done()}
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
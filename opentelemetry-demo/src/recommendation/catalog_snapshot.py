@@ -0,0 +1,180 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Compact on-disk snapshot of the catalog ProductIndex, for warm restarts.
+
+The file holds the product id array and each product's category numbers as
+little-endian uint32 offset arrays over two UTF-8 blobs:
+
+    header           magic, format version, counts, CRC-32 of the body, saved_at
+                     (last time the catalog was fetched unchanged, see touch())
+    id_offsets       n_products + 1 byte offsets into id_bytes
+    name_offsets     n_categories + 1 byte offsets into name_bytes
+    member_offsets   n_products + 1 offsets into members
+    members          category numbers of each product, in catalog order
+    id_bytes, name_bytes
+
+It is written aside and renamed into place, and memory-mapped on load, so a
+restarted instance rebuilds the exact index it last served without a
+ListProducts call.
+"""
+
+import array
+import logging
+import mmap
+import os
+import struct
+import sys
+import time
+import zlib
+
+from product_index import ProductIndex
+
+logger = logging.getLogger('main')
+
+MAGIC = b'RCAT'
+FORMAT_VERSION = 1
+# magic, format version, reserved, n_products, n_categories, n_members, crc32, saved_at
+HEADER = struct.Struct('<4sHHIIIId')
+SAVED_AT = struct.Struct('<d')
+SAVED_AT_OFFSET = HEADER.size - SAVED_AT.size
+
+
+def _uint32s(values):
+    values = array.array('I', values)
+    if sys.byteorder != 'little':
+        values.byteswap()
+    return values.tobytes()
+
+
+def _read_uint32s(buf):
+    values = array.array('I')
+    values.frombytes(buf)
+    if sys.byteorder != 'little':
+        values.byteswap()
+    return values
+
+
+def _blob(strings):
+    offsets = [0]
+    parts = []
+    for s in strings:
+        data = s.encode()
+        parts.append(data)
+        offsets.append(offsets[-1] + len(data))
+    return offsets, b''.join(parts)
+
+
+def _strings(blob, offsets):
+    text = blob.decode()
+    if len(text) != len(blob):
+        # Non-ASCII: offsets are in bytes, not characters
+        return [blob[offsets[i]:offsets[i + 1]].decode() for i in range(len(offsets) - 1)]
+    return [text[offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1)]
+
+
+def encode(index, saved_at):
+    """Serialize a ProductIndex."""
+    numbers = {}
+    member_offsets = [0]
+    members = []
+    for product_id in index.ids:
+        for category in index.categories.get(product_id, ()):
+            members.append(numbers.setdefault(category, len(numbers)))
+        member_offsets.append(len(members))
+    id_offsets, id_bytes = _blob(index.ids)
+    name_offsets, name_bytes = _blob(numbers)
+
+    body = b''.join((_uint32s(id_offsets), _uint32s(name_offsets), _uint32s(member_offsets),
+                     _uint32s(members), id_bytes, name_bytes))
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(index.ids), len(numbers), len(members),
+                         zlib.crc32(body), saved_at)
+    return header + body
+
+
+def decode(buf):
+    """Rebuild the ProductIndex from a serialized snapshot; returns (index, saved_at)."""
+    if len(buf) < HEADER.size:
+        raise ValueError("truncated header")
+    magic, version, _, n_products, n_categories, n_members, crc, saved_at = HEADER.unpack_from(buf)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"not a catalog snapshot (format {magic!r} v{version})")
+    with memoryview(buf) as view:
+        if zlib.crc32(view[HEADER.size:]) != crc:
+            raise ValueError("checksum mismatch")
+
+    offset = HEADER.size
+
+    def take_uint32s(count):
+        nonlocal offset
+        values = _read_uint32s(buf[offset:offset + 4 * count])
+        offset += 4 * count
+        return values
+
+    id_offsets = take_uint32s(n_products + 1)
+    name_offsets = take_uint32s(n_categories + 1)
+    member_offsets = take_uint32s(n_products + 1)
+    members = take_uint32s(n_members)
+    id_bytes = buf[offset:offset + id_offsets[-1]]
+    name_bytes = buf[offset + id_offsets[-1]:]
+    if len(id_bytes) != id_offsets[-1] or len(name_bytes) != name_offsets[-1]:
+        raise ValueError("truncated body")
+
+    names = _strings(name_bytes, name_offsets)
+    ids = _strings(id_bytes, id_offsets)
+    # Products mostly share a few category combinations, built once each
+    combinations = {}
+    categories = {}
+    for i, product_id in enumerate(ids):
+        key = members[member_offsets[i]:member_offsets[i + 1]].tobytes()
+        product_categories = combinations.get(key)
+        if product_categories is None:
+            product_categories = combinations[key] = tuple(
+                names[c] for c in members[member_offsets[i]:member_offsets[i + 1]])
+        categories[product_id] = product_categories
+    # Same construction as ProductIndex.from_products, so an unchanged catalog compares equal
+    return ProductIndex(categories, categories), saved_at
+
+
+def save(path, index, clock=time.time):
+    """Write the snapshot atomically; failures are logged, not raised."""
+    try:
+        data = encode(index, clock())
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp = f'{path}.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning("catalog snapshot: cannot write %s: %s", path, e)
+
+
+def touch(path, clock=time.time):
+    """Update saved_at in place, after a refresh found the catalog unchanged.
+
+    saved_at is outside the checksummed body, so the body is not rewritten.
+    """
+    try:
+        with open(path, 'r+b') as f:
+            f.seek(SAVED_AT_OFFSET)
+            f.write(SAVED_AT.pack(clock()))
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning("catalog snapshot: cannot update %s: %s", path, e)
+
+
+def load(path):
+    """Memory-map and decode the snapshot; returns (index, saved_at), or None
+    when there is no usable file."""
+    try:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return decode(mm)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        # Includes empty files, which cannot be mapped
+        logger.warning("catalog snapshot: ignoring unreadable %s: %s", path, e)
+        return None
@@ -0,0 +1,102 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Local snapshot of feature flag values.
+
+Reading a flag on the hot path is a dict lookup. Values are re-evaluated
+through the OpenFeature client (and so the flagd provider and its hooks) at
+most once per ``ttl`` seconds per flag, and the whole snapshot is dropped as
+soon as flagd streams a configuration change. When an entry expires a single
+caller re-evaluates it while concurrent callers keep answering with the
+previous value.
+"""
+
+import threading
+import time
+
+from openfeature import api
+from openfeature.event import ProviderEvent
+
+
+class FlagCache:
+    def __init__(self, ttl=5.0, avoided_counter=None, client_factory=api.get_client, clock=time.monotonic):
+        """
+        avoided_counter: optional OpenTelemetry Counter incremented for every
+                         evaluation answered from the snapshot
+        """
+        self.ttl = ttl
+        self._avoided_counter = avoided_counter
+        self._client_factory = client_factory
+        self._clock = clock
+        self._client = None
+        self._values = {}
+        self._refreshing = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def subscribe(self):
+        """Invalidate the snapshot on flagd configuration changes and provider (re)connects."""
+        api.add_handler(ProviderEvent.PROVIDER_CONFIGURATION_CHANGED, self.invalidate)
+        api.add_handler(ProviderEvent.PROVIDER_READY, self.invalidate)
+
+    def invalidate(self, *_):
+        with self._lock:
+            self._values = {}
+            self._generation += 1
+
+    def get_boolean(self, flag_name, default=False):
+        key = ('bool', flag_name, default)
+        entry = self._values.get(key)
+        now = self._clock()
+        if entry is not None and now - entry[1] < self.ttl:
+            self._record_avoided(flag_name)
+            return entry[0]
+
+        generation = None
+        with self._lock:
+            refreshed = self._refreshing.get(key)
+            if refreshed is None:
+                refreshed = self._refreshing[key] = threading.Event()
+                generation = self._generation
+        if generation is None:
+            # Another caller is already re-evaluating this flag
+            if entry is not None:
+                self._record_avoided(flag_name)
+                return entry[0]
+            refreshed.wait()
+            entry = self._values.get(key)
+            if entry is not None:
+                self._record_avoided(flag_name)
+                return entry[0]
+            return self._evaluate(flag_name, default)
+
+        try:
+            value = self._evaluate(flag_name, default)
+            with self._lock:
+                # An invalidation during the evaluation makes the value stale
+                if self._generation == generation:
+                    self._values[key] = (value, now)
+        finally:
+            with self._lock:
+                del self._refreshing[key]
+            refreshed.set()
+        return value
+
+    def peek_boolean(self, flag_name, default=False):
+        """Snapshot value of a flag, or None when reading it could evaluate through flagd."""
+        entry = self._values.get(('bool', flag_name, default))
+        if entry is not None and self._clock() - entry[1] < self.ttl:
+            self._record_avoided(flag_name)
+            return entry[0]
+        return None
+
+    def _evaluate(self, flag_name, default):
+        if self._client is None:
+            self._client = self._client_factory()
+        return self._client.get_boolean_value(flag_name, default)
+
+    def _record_avoided(self, flag_name):
+        if self._avoided_counter is not None:
+            self._avoided_counter.add(1, {'feature_flag.key': flag_name})
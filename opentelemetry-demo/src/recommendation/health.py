@@ -0,0 +1,158 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Serving status of the recommendation service for the gRPC health service.
+
+HealthMonitor re-evaluates the status every ``interval`` seconds and publishes
+changes to the grpc_health servicer, which answers Check and streams every
+change to Watch callers. The service is NOT_SERVING while
+
+* the catalog cache holds no snapshot yet ('catalog_cold')
+* the snapshot is older than ttl + max_stale and there are no popular products
+  to answer from either, so requests would block on ListProducts
+  ('catalog_expired'); with popular products it stays SERVING ('degraded')
+* more than ``max_queue_depth`` RPCs wait for a worker thread ('saturated');
+  it reports SERVING again once the queue has drained to half of that
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent import futures
+
+from grpc_health.v1 import health, health_pb2
+
+logger = logging.getLogger('main')
+
+SERVING = health_pb2.HealthCheckResponse.SERVING
+NOT_SERVING = health_pb2.HealthCheckResponse.NOT_SERVING
+
+# The overall server status and the recommendation service itself
+SERVICES = ('', 'oteldemo.RecommendationService')
+
+
+class HealthServicer(health.HealthServicer):
+    """grpc_health servicer whose Check and Watch run on their own small thread
+    pool, so probes of a saturated threaded server are not queued behind the
+    recommendation RPCs."""
+
+    # Shared by every instance; threads are only started on the first probe
+    _thread_pool = futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix='health')
+
+    def __init__(self):
+        super().__init__(experimental_non_blocking=True, experimental_thread_pool=self._thread_pool)
+
+    def Check(self, request, context):
+        return super().Check(request, context)
+
+    # gRPC runs a handler on the pool named by this attribute instead of the server's
+    Check.experimental_thread_pool = _thread_pool
+
+
+class AsyncHealthServicer(health.aio.HealthServicer):
+    """grpc_health aio servicer, with a Watch that keeps streaming to the other
+    watchers of a service when one of them disconnects (the base class drops
+    the condition they all wait on)."""
+
+    async def Watch(self, request, context):
+        condition = self._server_watchers[request.service]
+        last_status = None
+        async with condition:
+            while True:
+                status = self._server_status.get(request.service, health_pb2.HealthCheckResponse.SERVICE_UNKNOWN)
+                if status != last_status:
+                    await context.write(health_pb2.HealthCheckResponse(status=status))
+                    last_status = status
+                await condition.wait()
+
+
+class HealthMonitor:
+    def __init__(self, catalog_cache, popular_products=None, queue_depth=None, max_queue_depth=50, interval=0.25):
+        """
+        popular_products: optional PopularProducts answering while the catalog has expired
+        queue_depth: optional callable returning the RPCs waiting for a worker
+                     thread (threaded server mode)
+        """
+        self._catalog_cache = catalog_cache
+        self._popular_products = popular_products
+        self._queue_depth = queue_depth
+        self.max_queue_depth = max_queue_depth
+        self.interval = interval
+        self._saturated = False
+        self.status = NOT_SERVING
+        self.reason = 'catalog_cold'
+        self._stop = threading.Event()
+        self._task = None
+
+    def evaluate(self):
+        """Return the current (status, reason)."""
+        if self._queue_depth is not None:
+            depth = self._queue_depth()
+            # Hysteresis, so the status does not flap around the limit
+            if depth > self.max_queue_depth:
+                self._saturated = True
+            elif depth <= self.max_queue_depth // 2:
+                self._saturated = False
+        cache = self._catalog_cache
+        reason = 'ok'
+        if not cache.warm:
+            return NOT_SERVING, 'catalog_cold'
+        if cache.age() >= cache.ttl + cache.max_stale:
+            if self._popular_products is None or not len(self._popular_products.index):
+                return NOT_SERVING, 'catalog_expired'
+            reason = 'degraded'
+        if self._saturated:
+            return NOT_SERVING, 'saturated'
+        return SERVING, reason
+
+    @property
+    def serving(self):
+        return self.status == SERVING
+
+    def _update(self):
+        status, reason = self.evaluate()
+        changed = status != self.status
+        if changed or reason != self.reason:
+            logger.info("health: %s (%s)", health_pb2.HealthCheckResponse.ServingStatus.Name(status), reason)
+        self.status, self.reason = status, reason
+        return changed
+
+    def start(self, servicer):
+        """Publish the status to a grpc_health HealthServicer now, then from a background thread."""
+        self._update()
+        publish(servicer, self.status)
+
+        def run():
+            while not self._stop.wait(self.interval):
+                if self._update():
+                    publish(servicer, self.status)
+
+        threading.Thread(target=run, name='health-monitor', daemon=True).start()
+
+    async def start_async(self, servicer):
+        """Publish the status to a grpc_health aio HealthServicer now, then from an event loop task."""
+        self._update()
+        await publish_async(servicer, self.status)
+
+        async def run():
+            while not self._stop.is_set():
+                await asyncio.sleep(self.interval)
+                if self._update():
+                    await publish_async(servicer, self.status)
+
+        self._task = asyncio.create_task(run())
+
+    def stop(self):
+        self._stop.set()
+
+
+def publish(servicer, status):
+    for service in SERVICES:
+        servicer.set(service, status)
+
+
+async def publish_async(servicer, status):
+    for service in SERVICES:
+        await servicer.set(service, status)
@@ -0,0 +1,231 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Adaptive concurrency limit for the recommendation gRPC server.
+
+AIMDLimit grows the limit by one for every request that completes within
+``latency_threshold`` while at least half of the limit is in use, and cuts it
+by ``backoff_ratio`` for every slower request or one that ran past its
+deadline. Latency is measured from admission, so time queued for a worker
+thread counts.
+
+The server interceptors reject RPCs beyond the limit with RESOURCE_EXHAUSTED.
+In the threaded server the check runs on the gRPC polling thread before the
+RPC is queued for a worker, counting both the running handlers and the queued
+RPCs, and the server's AdmissionExecutor runs the rejection on its own thread,
+so excess requests fail fast instead of waiting in the queue. Health service
+RPCs are never limited.
+"""
+
+import contextvars
+import threading
+import time
+from concurrent import futures
+
+import grpc
+
+# Method prefixes never subject to the limit
+EXEMPT_PREFIXES = ('/grpc.health.v1.Health/',)
+
+REJECTED_DETAILS = 'recommendation service concurrency limit exceeded'
+
+# Set by ConcurrencyLimitInterceptor in the context of the RPCs it rejects
+_rejected = contextvars.ContextVar('recommendation_limiter_rejected', default=False)
+
+
+class AIMDLimit:
+    def __init__(self, initial=20, min_limit=4, max_limit=200, backoff_ratio=0.9, latency_threshold=0.1):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_threshold = latency_threshold
+        self._limit = float(max(min_limit, min(initial, max_limit)))
+        self._lock = threading.Lock()
+
+    @property
+    def value(self):
+        return int(self._limit)
+
+    def on_sample(self, latency, in_flight, dropped=False):
+        with self._lock:
+            if dropped or latency > self.latency_threshold:
+                self._limit = max(self.min_limit, self._limit * self.backoff_ratio)
+            elif in_flight * 2 >= self._limit:
+                self._limit = min(self.max_limit, self._limit + 1)
+
+
+class ConcurrencyLimiter:
+    def __init__(self, limit, queue_depth=None, rejected_counter=None, clock=time.perf_counter):
+        """
+        limit: AIMDLimit
+        queue_depth: optional callable returning the RPCs queued for a worker
+                     thread, counted as in flight (threaded server)
+        rejected_counter: optional OpenTelemetry Counter of rejected RPCs
+        """
+        self.limit = limit
+        self._queue_depth = queue_depth
+        self._rejected_counter = rejected_counter
+        self.clock = clock
+        self.executing = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    def in_flight(self):
+        queued = self._queue_depth() if self._queue_depth is not None else 0
+        return self.executing + queued
+
+    def admit(self, method):
+        if self.in_flight() < self.limit.value:
+            return True
+        with self._lock:
+            self.rejected += 1
+        if self._rejected_counter is not None:
+            self._rejected_counter.add(1, {'rpc.method': method.rsplit('/', 1)[-1]})
+        return False
+
+    def enter(self):
+        with self._lock:
+            self.executing += 1
+
+    def exit(self, admitted_at, context):
+        with self._lock:
+            in_flight = self.executing
+            self.executing -= 1
+        remaining = context.time_remaining()
+        self.limit.on_sample(self.clock() - admitted_at, in_flight,
+                             dropped=remaining is not None and remaining <= 0)
+
+
+def exempt(method):
+    return method.startswith(EXEMPT_PREFIXES)
+
+
+class AdmissionExecutor(futures.ThreadPoolExecutor):
+    """grpc.server thread pool that runs the RPCs rejected by
+    ConcurrencyLimitInterceptor on a thread of their own.
+
+    gRPC runs the interceptors and then the handler in one context per RPC
+    (``submit(context.run, ...)``), so the rejection is recognised here whatever
+    wraps the handler in between: the OpenTelemetry server interceptor rebuilds
+    every handler, dropping a per-handler ``experimental_thread_pool``.
+    """
+
+    def __init__(self, max_workers):
+        super().__init__(max_workers=max_workers)
+        # More than one, so a client slow to send its request cannot hold up the other rejections
+        self._rejections = futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix='limiter')
+
+    def submit(self, fn, /, *args, **kwargs):
+        context = getattr(fn, '__self__', None)
+        if isinstance(context, contextvars.Context) and context.get(_rejected):
+            return self._rejections.submit(fn, *args, **kwargs)
+        return super().submit(fn, *args, **kwargs)
+
+    def shutdown(self, wait=True, **kwargs):
+        super().shutdown(wait, **kwargs)
+        self._rejections.shutdown(wait, **kwargs)
+
+
+class ConcurrencyLimitInterceptor(grpc.ServerInterceptor):
+    """grpc.server interceptor enforcing a ConcurrencyLimiter, for a server
+    running on an AdmissionExecutor."""
+
+    def __init__(self, limiter):
+        self._limiter = limiter
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        method = handler_call_details.method
+        if handler is None or exempt(method):
+            return handler
+        if not self._limiter.admit(method):
+            _rejected.set(True)
+            return rejection_handler(handler, reject)
+        return self._limited(handler, self._limiter.clock())
+
+    def _limited(self, handler, admitted_at):
+        limiter = self._limiter
+        if handler.unary_unary is not None:
+            def unary_unary(request, context):
+                limiter.enter()
+                try:
+                    return handler.unary_unary(request, context)
+                finally:
+                    limiter.exit(admitted_at, context)
+
+            return grpc.unary_unary_rpc_method_handler(
+                unary_unary, handler.request_deserializer, handler.response_serializer)
+
+        if handler.unary_stream is not None:
+            def unary_stream(request, context):
+                limiter.enter()
+                try:
+                    yield from handler.unary_stream(request, context)
+                finally:
+                    limiter.exit(admitted_at, context)
+
+            return grpc.unary_stream_rpc_method_handler(
+                unary_stream, handler.request_deserializer, handler.response_serializer)
+
+        # The service has no client-streaming methods
+        return handler
+
+
+class AsyncConcurrencyLimitInterceptor(grpc.aio.ServerInterceptor):
+    """grpc.aio counterpart: handlers start right away on the event loop, so
+    the check and the rejection run in the handler itself."""
+
+    def __init__(self, limiter):
+        self._limiter = limiter
+
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+        method = handler_call_details.method
+        if handler is None or exempt(method):
+            return handler
+        limiter = self._limiter
+
+        if handler.unary_unary is not None:
+            async def unary_unary(request, context):
+                if not limiter.admit(method):
+                    await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, REJECTED_DETAILS)
+                admitted_at = limiter.clock()
+                limiter.enter()
+                try:
+                    return await handler.unary_unary(request, context)
+                finally:
+                    limiter.exit(admitted_at, context)
+
+            return grpc.unary_unary_rpc_method_handler(
+                unary_unary, handler.request_deserializer, handler.response_serializer)
+
+        if handler.unary_stream is not None:
+            async def unary_stream(request, context):
+                if not limiter.admit(method):
+                    await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, REJECTED_DETAILS)
+                admitted_at = limiter.clock()
+                limiter.enter()
+                try:
+                    async for response in handler.unary_stream(request, context):
+                        yield response
+                finally:
+                    limiter.exit(admitted_at, context)
+
+            return grpc.unary_stream_rpc_method_handler(
+                unary_stream, handler.request_deserializer, handler.response_serializer)
+
+        return handler
+
+
+def reject(request, context):
+    context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, REJECTED_DETAILS)
+
+
+def rejection_handler(handler, reject):
+    if handler.unary_unary is not None:
+        return grpc.unary_unary_rpc_method_handler(
+            reject, handler.request_deserializer, handler.response_serializer)
+    return grpc.unary_stream_rpc_method_handler(
+        reject, handler.request_deserializer, handler.response_serializer)
@@ -3,25 +3,162 @@
 # Copyright The OpenTelemetry Authors
 # SPDX-License-Identifier: Apache-2.0
 
+import atexit
+import copy
+import json
 import logging
+import queue
+import re
 import sys
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
 from pythonjsonlogger import jsonlogger
 from opentelemetry import trace
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional, falls back to the json module
+    orjson = None
+
+JSON_LOG_FORMAT = '%(asctime)s %(levelname)s [%(name)s] [%(filename)s:%(lineno)d] [trace_id=%(otelTraceID)s span_id=%(otelSpanID)s] - %(message)s'
+
 
 class CustomJsonFormatter(jsonlogger.JsonFormatter):
     def add_fields(self, log_record, record, message_dict):
         super(CustomJsonFormatter, self).add_fields(log_record, record, message_dict)
-        if not log_record.get('otelTraceID'):
-            log_record['otelTraceID'] = trace.format_trace_id(trace.get_current_span().get_span_context().trace_id)
-        if not log_record.get('otelSpanID'):
-            log_record['otelSpanID'] = trace.format_span_id(trace.get_current_span().get_span_context().span_id)
+        if not log_record.get('otelTraceID') or not log_record.get('otelSpanID'):
+            # Captured on the logging thread by DroppingQueueHandler, else looked up here
+            span_context = getattr(record, '_otel_span_context', None)
+            if span_context is None:
+                span_context = trace.get_current_span().get_span_context()
+            if not log_record.get('otelTraceID'):
+                log_record['otelTraceID'] = trace.format_trace_id(span_context.trace_id)
+            if not log_record.get('otelSpanID'):
+                log_record['otelSpanID'] = trace.format_span_id(span_context.span_id)
+
+
+class FastJsonFormatter(logging.Formatter):
+    """JSON formatter producing the same fields as CustomJsonFormatter, faster.
+
+    The format string is compiled once into (key, getter) pairs. Each thread
+    reuses one output dict and caches the formatted trace/span ids of the last
+    span context and the timestamp of the current second. Encoding uses orjson
+    when it is installed. Extra record attributes are not added.
+    """
+
+    def __init__(self, fmt=JSON_LOG_FORMAT, datefmt=None):
+        super().__init__(fmt, datefmt)
+        self._fields = tuple(dict.fromkeys(re.findall(r'%\((.+?)\)', fmt)))
+        self._layout = tuple((field, self._getter(field)) for field in self._fields)
+        self._local = threading.local()
+        self._encode = self._orjson_encode if orjson is not None else \
+            json.JSONEncoder(ensure_ascii=False, default=str).encode
+
+    def _getter(self, field):
+        if field == 'message':
+            return lambda record, local: record.getMessage()
+        if field == 'asctime':
+            return self._asctime
+        if field == 'otelTraceID':
+            return lambda record, local: self._span_ids(record, local)[0]
+        if field == 'otelSpanID':
+            return lambda record, local: self._span_ids(record, local)[1]
+        return lambda record, local: getattr(record, field, None)
+
+    @staticmethod
+    def _orjson_encode(log_record):
+        return orjson.dumps(log_record, default=str).decode()
+
+    def _thread_state(self):
+        local = self._local
+        if not hasattr(local, 'buffer'):
+            local.buffer = dict.fromkeys(self._fields)
+            local.span_key = None
+            local.span_ids = None
+            local.second = None
+            local.second_text = None
+        return local
+
+    def _span_ids(self, record, local):
+        span_context = getattr(record, '_otel_span_context', None)
+        if span_context is None:
+            # Looked up once, shared by the trace and the span id fields
+            span_context = record._otel_span_context = trace.get_current_span().get_span_context()
+        key = (span_context.trace_id, span_context.span_id)
+        if key != local.span_key:
+            local.span_key = key
+            local.span_ids = (trace.format_trace_id(key[0]), trace.format_span_id(key[1]))
+        return local.span_ids
+
+    def _asctime(self, record, local):
+        if self.datefmt:
+            return self.formatTime(record, self.datefmt)
+        second = int(record.created)
+        if second != local.second:
+            local.second = second
+            local.second_text = time.strftime(self.default_time_format, self.converter(record.created))
+        return self.default_msec_format % (local.second_text, record.msecs)
+
+    def format(self, record):
+        local = self._thread_state()
+        log_record = local.buffer
+        for key, get in self._layout:
+            log_record[key] = get(record, local)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            log_record['exc_info'] = record.exc_text
+        else:
+            log_record.pop('exc_info', None)
+        return self._encode(log_record)
+
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler for a bounded queue that drops (and counts) records instead of blocking."""
+
+    def __init__(self, log_queue, dropped_counter=None):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._dropped_counter = dropped_counter
+        self._lock = threading.Lock()
+
+    def prepare(self, record):
+        # Only the message and the span context are resolved on the logging
+        # thread; JSON encoding is left to the QueueListener thread
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        record._otel_span_context = trace.get_current_span().get_span_context()
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            if self._dropped_counter is not None:
+                self._dropped_counter.add(1)
+
 
-def getJSONLogger(name):
+def getJSONLogger(name, queue_size=10000, dropped_counter=None, formatter_class=FastJsonFormatter):
+    """
+    queue_size: bound of the queue between the logging threads and the stdout
+                writer thread, 0 writes synchronously from the logging thread
+    dropped_counter: optional OpenTelemetry Counter of records dropped on a full queue
+    formatter_class: FastJsonFormatter or the python-json-logger based CustomJsonFormatter
+    """
     logger = logging.getLogger(name)
     handler = logging.StreamHandler(sys.stdout)
-    formatter = CustomJsonFormatter('%(asctime)s %(levelname)s [%(name)s] [%(filename)s:%(lineno)d] [trace_id=%(otelTraceID)s span_id=%(otelSpanID)s] - %(message)s')
+    formatter = formatter_class(JSON_LOG_FORMAT)
     handler.setFormatter(formatter)
+    if queue_size:
+        log_queue = queue.Queue(maxsize=queue_size)
+        listener = QueueListener(log_queue, handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        handler = DroppingQueueHandler(log_queue, dropped_counter)
     logger.addHandler(handler)
     logger.setLevel(logging.INFO)
     logger.propagate = False
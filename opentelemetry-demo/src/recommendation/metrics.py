@@ -3,6 +3,15 @@
 # Copyright The OpenTelemetry Authors
 # SPDX-License-Identifier: Apache-2.0
 
+from opentelemetry.metrics import Observation
+
+# Seconds, from sub-millisecond cache hits up to the catalog client deadline
+LATENCY_BUCKETS = [0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10]
+
+# Products a recommendation is picked from, up to very large catalogs
+CANDIDATE_BUCKETS = [0, 5, 10, 50, 100, 500, 1000, 5000, 10000, 50000, 100000, 500000, 1000000]
+
+
 def init_metrics(meter):
 
     # Recommendations counter
@@ -10,8 +19,132 @@ def init_metrics(meter):
         'app_recommendations_counter', unit='recommendations', description="Counts the total number of given recommendations"
     )
 
+    # Flag evaluations answered from the local snapshot instead of the flagd provider
+    app_flag_evaluations_avoided_counter = meter.create_counter(
+        'app_flag_evaluations_avoided', unit='evaluations', description="Counts feature flag provider round-trips avoided by the local flag cache"
+    )
+
+    # Product catalog RPC attempts in flight, per channel of the client pool
+    app_catalog_client_in_flight = meter.create_up_down_counter(
+        'app_catalog_client_in_flight', unit='requests', description="Product catalog RPC attempts in flight per client channel"
+    )
+
+    # Log records dropped because the stdout JSON log queue was full, see logger.py
+    app_log_records_dropped = meter.create_counter(
+        'app_log_records_dropped', unit='records', description="Counts log records dropped by the non-blocking stdout JSON log handler"
+    )
+
+    # Server-side handling time of recommendation RPCs
+    app_recommendation_request_duration = meter.create_histogram(
+        'app_recommendation_request_duration', unit='s', description="Duration of recommendation RPCs handled by the service",
+        explicit_bucket_boundaries_advisory=LATENCY_BUCKETS,
+    )
+
+    # Catalog cache refreshes, i.e. ListProducts round-trips plus index build
+    app_catalog_fetch_duration = meter.create_histogram(
+        'app_catalog_fetch_duration', unit='s', description="Duration of product catalog fetches made by the catalog cache",
+        explicit_bucket_boundaries_advisory=LATENCY_BUCKETS,
+    )
+
+    # Products left to pick from once the requested ones are excluded
+    app_recommendation_candidates = meter.create_histogram(
+        'app_recommendation_candidates', unit='products', description="Candidate set size of each recommendation request",
+        explicit_bucket_boundaries_advisory=CANDIDATE_BUCKETS,
+    )
+
+    # RPCs turned away by the adaptive concurrency limiter, see limiter.py
+    app_recommendation_limiter_rejected = meter.create_counter(
+        'app_recommendation_limiter_rejected', unit='requests', description="Counts RPCs rejected with RESOURCE_EXHAUSTED by the concurrency limiter"
+    )
+
+    # Requests answered from the popular products because the catalog was late or failing
+    app_recommendation_degraded = meter.create_counter(
+        'app_recommendation_degraded', unit='requests', description="Counts recommendation requests answered in degraded mode from the popular products"
+    )
+
+    # Process creation to each start-up phase, see startup.py
+    app_recommendation_startup_duration = meter.create_histogram(
+        'app_recommendation_startup_duration', unit='s', description="Time from process creation to each start-up phase of the service",
+        explicit_bucket_boundaries_advisory=LATENCY_BUCKETS,
+    )
+
     rec_svc_metrics = {
         "app_recommendations_counter": app_recommendations_counter,
+        "app_flag_evaluations_avoided_counter": app_flag_evaluations_avoided_counter,
+        "app_catalog_client_in_flight": app_catalog_client_in_flight,
+        "app_log_records_dropped": app_log_records_dropped,
+        "app_recommendation_request_duration": app_recommendation_request_duration,
+        "app_catalog_fetch_duration": app_catalog_fetch_duration,
+        "app_recommendation_candidates": app_recommendation_candidates,
+        "app_recommendation_startup_duration": app_recommendation_startup_duration,
+        "app_recommendation_limiter_rejected": app_recommendation_limiter_rejected,
+        "app_recommendation_degraded": app_recommendation_degraded,
     }
 
     return rec_svc_metrics
+
+
+def observe_catalog_cache(meter, catalog_cache):
+    """Export the catalog cache lookups by state and the current snapshot size and age."""
+
+    def lookups(options):
+        stats = catalog_cache.stats
+        return [Observation(stats[state], {'catalog_cache.state': state}) for state in ('hit', 'stale', 'miss')]
+
+    def size(options):
+        snapshot = catalog_cache.snapshot
+        return [Observation(snapshot.size if snapshot is not None else 0)]
+
+    def age(options):
+        age = catalog_cache.age()
+        return [Observation(age)] if age is not None else []
+
+    meter.create_observable_counter(
+        'app_catalog_cache_lookups', callbacks=[lookups], unit='lookups',
+        description="Catalog cache lookups by state (hit, stale or miss)")
+    meter.create_observable_gauge(
+        'app_catalog_cache_size', callbacks=[size], unit='products',
+        description="Products in the current catalog cache snapshot")
+    meter.create_observable_gauge(
+        'app_catalog_cache_age', callbacks=[age], unit='s',
+        description="Age of the current catalog cache snapshot")
+
+
+def observe_executor(meter, executor):
+    """Export the number of RPCs waiting for a worker of the threaded server's pool."""
+
+    def queue_depth(options):
+        # ThreadPoolExecutor has no public accessor for its pending work items
+        return [Observation(executor._work_queue.qsize())]
+
+    meter.create_observable_gauge(
+        'app_recommendation_executor_queue_depth', callbacks=[queue_depth], unit='requests',
+        description="RPCs queued for a worker thread of the recommendation server")
+
+
+def observe_health(meter, health_monitor):
+    """Export the serving status reported to the gRPC health service, with its reason."""
+
+    def serving(options):
+        return [Observation(1 if health_monitor.serving else 0, {'health.reason': health_monitor.reason})]
+
+    meter.create_observable_gauge(
+        'app_recommendation_serving', callbacks=[serving],
+        description="1 while the health service reports SERVING, else 0 (health.reason tells why)")
+
+
+def observe_limiter(meter, limiter):
+    """Export the adaptive concurrency limit and the RPCs it currently counts as in flight."""
+
+    def limit(options):
+        return [Observation(limiter.limit.value)]
+
+    def in_flight(options):
+        return [Observation(limiter.in_flight())]
+
+    meter.create_observable_gauge(
+        'app_recommendation_limiter_limit', callbacks=[limit], unit='requests',
+        description="Current adaptive concurrency limit of the recommendation server")
+    meter.create_observable_gauge(
+        'app_recommendation_limiter_in_flight', callbacks=[in_flight], unit='requests',
+        description="RPCs running or queued, as counted by the concurrency limiter")
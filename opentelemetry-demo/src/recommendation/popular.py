@@ -0,0 +1,137 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Popular products, answered from when the product catalog is unavailable.
+
+Request product ids are counted as they arrive, at most ``max_tracked``
+distinct ones. Every refresh ranks them (the previous period's counts are kept
+at half weight, also while there is no catalog), keeps the ``size`` most
+requested ids that exist in the catalog, tops the list up from the catalog,
+and writes it with the products' categories to a small JSON snapshot file, so
+a restarted instance can answer in degraded mode before its first catalog
+fetch.
+"""
+
+import collections
+import json
+import logging
+import os
+import threading
+import time
+
+from product_index import ProductIndex
+
+logger = logging.getLogger('main')
+
+
+class PopularIndex(ProductIndex):
+    """ProductIndex of the popular products; recommendations picked from it are degraded."""
+
+    __slots__ = ()
+
+
+class PopularProducts:
+    def __init__(self, size=20, path=None, max_tracked=10000, clock=time.time):
+        """
+        path: snapshot file, None keeps the list in memory only
+        max_tracked: distinct request ids counted between refreshes; beyond it
+                     only the most requested half is kept
+        """
+        self.size = size
+        self.max_tracked = max_tracked
+        self.path = path
+        self._clock = clock
+        self._counts = collections.Counter()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self.index = PopularIndex(())
+        self.updated_at = None
+
+    def record(self, product_ids):
+        if product_ids:
+            with self._lock:
+                self._counts.update(product_ids)
+                if len(self._counts) > self.max_tracked:
+                    self._counts = collections.Counter(dict(self._counts.most_common(self.max_tracked // 2)))
+
+    def refresh(self, catalog=None):
+        """Re-rank the popular products against ``catalog`` (a ProductIndex) and persist them.
+
+        Without a catalog the counts still decay and the current list is kept.
+        """
+        if catalog is not None and not len(catalog):
+            catalog = None
+        with self._lock:
+            counts = self._counts
+            # Half of this period's counts carry over, ids unknown to the catalog do not
+            self._counts = collections.Counter({product_id: count // 2 for product_id, count in counts.items()
+                                                if count > 1 and (catalog is None or product_id in catalog)})
+        if catalog is None:
+            return self.index
+
+        ranked = [product_id for product_id, _ in counts.most_common() if product_id in catalog][:self.size]
+        if len(ranked) < self.size:
+            chosen = set(ranked)
+            for product_id in catalog.ids:
+                if len(ranked) >= self.size:
+                    break
+                if product_id not in chosen:
+                    ranked.append(product_id)
+        self._set({product_id: catalog.categories.get(product_id, ()) for product_id in ranked}, self._clock())
+        self.save()
+        return self.index
+
+    def _set(self, categories, updated_at):
+        self.index = PopularIndex(categories, categories)
+        self.updated_at = updated_at
+
+    def save(self):
+        if not self.path:
+            return
+        snapshot = {
+            'updated_at': self.updated_at,
+            'products': [{'id': product_id, 'categories': list(categories)}
+                         for product_id, categories in self.index.categories.items()],
+        }
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            # Written aside and renamed, readers never see a partial file
+            tmp = f'{self.path}.tmp'
+            with open(tmp, 'w') as f:
+                json.dump(snapshot, f)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning("popular products: cannot write %s: %s", self.path, e)
+
+    def load(self):
+        """Load the snapshot file, if any; returns the number of popular products."""
+        if not self.path:
+            return 0
+        try:
+            with open(self.path) as f:
+                snapshot = json.load(f)
+            categories = {product['id']: tuple(product['categories']) for product in snapshot['products']}
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("popular products: ignoring unreadable %s: %s", self.path, e)
+            return 0
+        self._set(categories, snapshot.get('updated_at'))
+        return len(self.index)
+
+    def start(self, catalog, interval=60.0):
+        """Refresh every ``interval`` seconds from a background thread; catalog() returns the current ProductIndex or None."""
+
+        def run():
+            while not self._stop.wait(interval):
+                try:
+                    self.refresh(catalog())
+                except Exception as e:
+                    logger.warning("popular products: refresh failed: %s", e)
+
+        threading.Thread(target=run, name='popular-products', daemon=True).start()
+
+    def stop(self):
+        self._stop.set()
@@ -0,0 +1,38 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Decoding of the ``product_ids`` field of recommendation requests.
+
+Clients send the requested ids in one of three shapes:
+
+* repeated field, one id per value: ``["OLJCESPC7Z", "66VCHSJNUP"]``
+* comma-joined legacy form: ``["OLJCESPC7Z,66VCHSJNUP"]``
+* the legacy string assigned to the repeated field, which splits it into one
+  value per character: ``["O", "L", "J", ..., ",", "6", ...]``
+
+Product ids are longer than one character, so a request made only of
+single-character values is taken to be the last shape.
+
+normalize_product_ids() returns the plain list of ids for all of them. The
+values are copied out of the protobuf container once; the common repeated form
+is then returned as is after two C-level checks, with no id split or rebuilt.
+"""
+
+
+def normalize_product_ids(product_ids):
+    """Return the request's product ids as a list of non-empty strings."""
+    ids = product_ids[:]
+    if len(ids) > 1 and len(ids[0]) == 1:
+        joined = ''.join(ids)
+        if len(joined) == len(ids):
+            # One value per character
+            ids = joined.split(',')
+            return ids if all(ids) else [x for x in ids if x]
+
+    if all(ids) and ',' not in ''.join(ids):
+        return ids
+    # Comma-joined values, possibly mixed with plain ids
+    ids = ','.join(ids).split(',')
+    return ids if all(ids) else [x for x in ids if x]
@@ -0,0 +1,109 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Precomputed product id index used to pick recommendations.
+
+The index is built once per catalog change. Picking ``k`` recommendations uses
+rejection sampling against the (small) set of excluded request ids, so the
+per-request cost is O(k) instead of O(catalog). An inverted category -> ids
+index lets callers prefer products that share a category with the request.
+"""
+
+import random
+
+
+class ProductIndex:
+    __slots__ = ('ids', 'positions', 'categories', 'by_category')
+
+    def __init__(self, ids, categories=None):
+        """categories: optional {product_id: (category, ...)} mapping"""
+        # dict.fromkeys de-duplicates while keeping catalog order
+        self.ids = tuple(dict.fromkeys(ids))
+        self.positions = {product_id: i for i, product_id in enumerate(self.ids)}
+        self.categories = categories or {}
+        by_category = {}
+        for product_id, product_categories in self.categories.items():
+            for category in product_categories:
+                by_category.setdefault(category, []).append(product_id)
+        self.by_category = {category: tuple(ids) for category, ids in by_category.items()}
+
+    @classmethod
+    def from_products(cls, products, previous=None):
+        """Build an index from catalog Products, reusing ``previous`` if nothing changed."""
+        categories = {}
+        for x in products:
+            if x.id not in categories:
+                categories[x.id] = tuple(x.categories)
+        if previous is not None and previous.categories == categories:
+            return previous
+        return cls(categories, categories)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, product_id):
+        return product_id in self.positions
+
+    def present(self, product_ids):
+        """The subset of product_ids that exist in the catalog."""
+        positions = self.positions
+        return {product_id for product_id in product_ids if product_id in positions}
+
+    def sample(self, k, excluded=frozenset(), rng=random):
+        """Pick up to k distinct ids not in ``excluded`` (a subset of the index, see present())."""
+        ids = self.ids
+        n = len(ids)
+        available = n - len(excluded)
+        k = min(k, available)
+        if k <= 0:
+            return []
+        if 2 * k > available:
+            # Almost everything is requested: rejection sampling would spin, filter instead
+            return rng.sample([x for x in ids if x not in excluded], k)
+
+        chosen = []
+        seen = set(excluded)
+        while len(chosen) < k:
+            product_id = ids[rng.randrange(n)]
+            if product_id not in seen:
+                seen.add(product_id)
+                chosen.append(product_id)
+        return chosen
+
+    def sample_related(self, k, product_ids, excluded=frozenset(), rng=random):
+        """Pick up to k ids sharing a category with product_ids, topped up at random.
+
+        Returns (chosen_ids, number_of_same_category_picks).
+        """
+        pools = []
+        seen_categories = set()
+        for product_id in product_ids:
+            for category in self.categories.get(product_id, ()):
+                if category not in seen_categories:
+                    seen_categories.add(category)
+                    pools.append(self.by_category[category])
+
+        chosen = []
+        seen = set(excluded)
+        if pools:
+            total = sum(len(pool) for pool in pools)
+            # Bounded so that small, mostly excluded categories cannot spin
+            attempts = 4 * k
+            while len(chosen) < k and attempts:
+                attempts -= 1
+                r = rng.randrange(total)
+                for pool in pools:
+                    if r < len(pool):
+                        break
+                    r -= len(pool)
+                product_id = pool[r]
+                if product_id not in seen:
+                    seen.add(product_id)
+                    chosen.append(product_id)
+
+        related = len(chosen)
+        if related < k:
+            chosen.extend(self.sample(k - related, seen, rng))
+        return chosen, related
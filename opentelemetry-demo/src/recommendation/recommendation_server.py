@@ -5,112 +5,346 @@
 
 
 # Python
+import asyncio
 import os
 import random
-from concurrent import futures
+import threading
+import time
 
 # Pip
 import grpc
 from opentelemetry import trace, metrics
-from opentelemetry._logs import set_logger_provider
-from opentelemetry.exporter.otlp.proto.grpc._log_exporter import (
-    OTLPLogExporter,
-)
-from opentelemetry.sdk._logs import LoggerProvider, LoggingHandler
-from opentelemetry.sdk._logs.export import BatchLogRecordProcessor
-from opentelemetry.sdk.resources import Resource
 
 from openfeature import api
-from openfeature.contrib.provider.flagd import FlagdProvider
-
-from openfeature.contrib.hook.opentelemetry import TracingHook
 
 # Local
 import logging
 import demo_pb2
 import demo_pb2_grpc
-from grpc_health.v1 import health_pb2
 from grpc_health.v1 import health_pb2_grpc
 
 from metrics import (
-    init_metrics
+    init_metrics,
+    observe_catalog_cache,
+    observe_executor,
+    observe_health,
+    observe_limiter,
 )
-
-cached_ids = []
-first_run = True
-
-class RecommendationService(demo_pb2_grpc.RecommendationServiceServicer):
-    def ListRecommendations(self, request, context):
-        prod_list = get_product_list(request.product_ids)
+import catalog_snapshot
+from catalog_cache import CatalogCache
+from catalog_client import CatalogClient
+from popular import PopularIndex, PopularProducts
+from product_index import ProductIndex
+from product_ids import normalize_product_ids
+from flags import FlagCache
+from health import AsyncHealthServicer, HealthMonitor, HealthServicer
+from limiter import (
+    AdmissionExecutor,
+    AIMDLimit,
+    AsyncConcurrencyLimitInterceptor,
+    ConcurrencyLimiter,
+    ConcurrencyLimitInterceptor,
+)
+from startup import StartupTimer
+from telemetry import FULL, TelemetryPolicy
+
+# The OpenTelemetry logs SDK and OTLP exporter, the flagd provider and the JSON
+# logger are imported by the create_app() steps that set them up
+
+logger = logging.getLogger('main')
+
+
+class RecommendationApp:
+    """State of one recommendation service instance, returned by create_app().
+
+    The servicers and the serve_* functions take it explicitly, so benchmarks
+    can build isolated instances with their own tracer, flags and catalog.
+    The catalog cache and health monitor are added by serve_threaded() or
+    serve_async(), which build them for their server mode.
+    """
+
+    def __init__(self, tracer, meter, rec_svc_metrics, flag_cache, popular_products, catalog_client=None,
+                 telemetry=None, strategy='category', fallback_budget=0.2):
+        self.tracer = tracer
+        self.meter = meter
+        self.rec_svc_metrics = rec_svc_metrics
+        self.flag_cache = flag_cache
+        self.popular_products = popular_products
+        self.catalog_client = catalog_client
+        # Per-request span attributes and logs, see telemetry.py
+        self.telemetry = telemetry or TelemetryPolicy()
+        # 'category' prefers products sharing a category with the requested ones, 'random' ignores categories
+        self.strategy = strategy
+        # Longest a request waits for the product catalog before it is answered
+        # from the popular products instead, see popular.py
+        self.fallback_budget = fallback_budget
+        self.catalog_cache = None
+        self.health_monitor = None
+        # Feature flag scenario - Cache Leak state
+        self.cached_ids = []
+        self.first_run = True
+
+    def record_request_duration(self, method, start):
+        self.rec_svc_metrics["app_recommendation_request_duration"].record(
+            time.perf_counter() - start, {'rpc.method': method})
+
+    def build_response(self, prod_list):
         span = trace.get_current_span()
-        span.set_attribute("app.products_recommended.count", len(prod_list))
-        logger.info(f"Receive ListRecommendations for product ids:{prod_list}")
+        if self.telemetry.records(span):
+            span.set_attribute("app.products_recommended.count", len(prod_list))
+        self.telemetry.log_request(logger, "Receive ListRecommendations for product ids:%s", prod_list)
 
         # build and return response
         response = demo_pb2.ListRecommendationsResponse()
         response.product_ids.extend(prod_list)
 
-        # Collect metrics for this service
-        rec_svc_metrics["app_recommendations_counter"].add(len(prod_list), {'recommendation.type': 'catalog'})
-
         return response
 
-    def Check(self, request, context):
-        return health_pb2.HealthCheckResponse(
-            status=health_pb2.HealthCheckResponse.SERVING)
-
-    def Watch(self, request, context):
-        return health_pb2.HealthCheckResponse(
-            status=health_pb2.HealthCheckResponse.UNIMPLEMENTED)
-
+    def build_batch_response(self, prod_lists):
+        span = trace.get_current_span()
+        count = sum(len(prod_list) for prod_list in prod_lists)
+        if self.telemetry.records(span):
+            span.set_attribute("app.products_recommended.count", count)
+        self.telemetry.log_request(logger, "Receive ListRecommendationsBatch for %d requests", len(prod_lists))
 
-def get_product_list(request_product_ids):
-    global first_run
-    global cached_ids
-    with tracer.start_as_current_span("get_product_list") as span:
-        max_responses = 5
+        response = demo_pb2.ListRecommendationsBatchResponse()
+        for prod_list in prod_lists:
+            response.responses.add().product_ids.extend(prod_list)
 
-        # Formulate the list of characters to list of strings
-        request_product_ids_str = ''.join(request_product_ids)
-        request_product_ids = request_product_ids_str.split(',')
+        return response
 
-        # Feature flag scenario - Cache Leak
-        if check_feature_flag("recommendationCacheFailure"):
+    def get_product_list(self, request_product_ids):
+        with self.tracer.start_as_current_span("get_product_list") as span:
+            request_product_ids = normalize_product_ids(request_product_ids)
+            if self.telemetry.records(span):
+                span.set_attribute("app.recommendation.request_ids.count", len(request_product_ids))
+            index = self.recommendation_index(span)
+            return self.pick_recommendations(span, index, request_product_ids)
+
+    async def get_product_list_async(self, request_product_ids):
+        with self.tracer.start_as_current_span("get_product_list") as span:
+            request_product_ids = normalize_product_ids(request_product_ids)
+            if self.telemetry.records(span):
+                span.set_attribute("app.recommendation.request_ids.count", len(request_product_ids))
+            index = await self.recommendation_index_async(span)
+            return self.pick_recommendations(span, index, request_product_ids)
+
+    def get_product_lists(self, requests):
+        with self.tracer.start_as_current_span("get_product_lists") as span:
+            index = self.recommendation_index(span)
+            return list(self.iter_recommendations(span, index, requests))
+
+    async def get_product_lists_async(self, requests):
+        with self.tracer.start_as_current_span("get_product_lists") as span:
+            index = await self.recommendation_index_async(span)
+            return list(self.iter_recommendations(span, index, requests))
+
+    def iter_recommendations(self, span, index, requests):
+        # Every request of a batch is answered from the same index
+        related = 0
+        count = 0
+        for request in requests:
+            prod_list, same_category = self.recommend(index, normalize_product_ids(request.product_ids))
+            related += same_category
+            count += len(prod_list)
+            yield prod_list
+        # Collect metrics for this service
+        self.rec_svc_metrics["app_recommendations_counter"].add(
+            count, {'recommendation.type': recommendation_type(index)})
+        if self.telemetry.records(span):
+            span.set_attributes({
+                "app.recommendation.batch.size": len(requests),
+                "app.recommendation.strategy": self.strategy,
+                "app.recommendation.same_category.count": related,
+            })
+
+    def recommendation_index(self, span):
+        # Feature flag scenario - Cache Leak (fault injection only: the unbounded
+        # cached_ids list below is intentional and replaces the real catalog cache)
+        if self.check_feature_flag("recommendationCacheFailure"):
+            # Fault injection scenario, always fully recorded
             span.set_attribute("app.recommendation.cache_enabled", True)
-            if random.random() < 0.5 or first_run:
-                first_run = False
+            if random.random() < 0.5 or self.first_run:
+                self.first_run = False
                 span.set_attribute("app.cache_hit", False)
                 logger.info("get_product_list: cache miss")
-                cat_response = product_catalog_stub.ListProducts(demo_pb2.Empty())
-                response_ids = [x.id for x in cat_response.products]
-                cached_ids = cached_ids + response_ids
-                cached_ids = cached_ids + cached_ids[:len(cached_ids) // 4]
-                product_ids = cached_ids
+                products = self.catalog_client.list_products()
+                response_ids = [x.id for x in products]
+                self.cached_ids = self.cached_ids + response_ids
+                self.cached_ids = self.cached_ids + self.cached_ids[:len(self.cached_ids) // 4]
+                product_ids = self.cached_ids
             else:
                 span.set_attribute("app.cache_hit", True)
                 logger.info("get_product_list: cache hit")
-                product_ids = cached_ids
-        else:
-            span.set_attribute("app.recommendation.cache_enabled", False)
-            cat_response = product_catalog_stub.ListProducts(demo_pb2.Empty())
-            product_ids = [x.id for x in cat_response.products]
+                product_ids = self.cached_ids
+            span.set_attribute("app.products.count", len(product_ids))
+            # The leaky cache is re-indexed on every request, O(len(cached_ids))
+            return ProductIndex(product_ids)
+
+        try:
+            return self.catalog_index(span, *self.catalog_cache.get_with_state(timeout=self.degraded_budget()))
+        except (TimeoutError, grpc.RpcError) as e:
+            return self.popular_index(span, e)
+
+    async def recommendation_index_async(self, span):
+        if await self.check_feature_flag_async("recommendationCacheFailure"):
+            # Fault injection path uses the blocking catalog client, keep it off the event loop
+            return await asyncio.to_thread(self.recommendation_index, span)
+        try:
+            return self.catalog_index(span, *await self.catalog_cache.aget_with_state(timeout=self.degraded_budget()))
+        except (TimeoutError, grpc.RpcError) as e:
+            return self.popular_index(span, e)
+
+    def degraded_budget(self):
+        # Without popular products to fall back to, wait for the catalog as long as it takes
+        return self.fallback_budget if len(self.popular_products.index) else None
+
+    def popular_index(self, span, error):
+        """Degraded mode: the catalog missed the fallback budget or failed, answer from the popular products."""
+        index = self.popular_products.index
+        if not len(index):
+            raise error
+        reason = 'timeout' if isinstance(error, TimeoutError) else 'catalog_error'
+        self.rec_svc_metrics["app_recommendation_degraded"].add(1, {'degraded.reason': reason})
+        # Always recorded, like the fault injection scenario
+        span.set_attributes({
+            "app.recommendation.degraded": True,
+            "app.recommendation.degraded.reason": reason,
+            "app.products.count": len(index),
+        })
+        return index
+
+    def catalog_index(self, span, snapshot, cache_state):
+        index = snapshot.value
+        if self.telemetry.records(span):
+            span.set_attributes({
+                "app.recommendation.cache_enabled": False,
+                "app.catalog_cache.state": cache_state,
+                "app.catalog_cache.version": snapshot.version,
+                "app.products.count": len(index),
+            })
+        return index
+
+    def pick_recommendations(self, span, index, request_product_ids):
+        # Sample from the precomputed index excluding the products received as input
+        excluded = index.present(request_product_ids)
+        prod_list, related = self.recommend(index, request_product_ids, excluded)
 
-        span.set_attribute("app.products.count", len(product_ids))
+        # Collect metrics for this service
+        self.rec_svc_metrics["app_recommendations_counter"].add(
+            len(prod_list), {'recommendation.type': recommendation_type(index)})
 
-        # Create a filtered list of products excluding the products received as input
-        filtered_products = list(set(product_ids) - set(request_product_ids))
-        num_products = len(filtered_products)
-        span.set_attribute("app.filtered_products.count", num_products)
-        num_return = min(max_responses, num_products)
+        if self.telemetry.records(span):
+            attributes = {
+                "app.filtered_products.count": len(index) - len(excluded),
+                "app.recommendation.strategy": self.strategy,
+            }
+            if self.strategy == 'category':
+                attributes["app.recommendation.same_category.count"] = related
+            if self.telemetry.records(span, FULL):
+                attributes["app.filtered_products.list"] = self.telemetry.cap(prod_list)
+            span.set_attributes(attributes)
 
-        # Sample list of indicies to return
-        indices = random.sample(range(num_products), num_return)
-        # Fetch product ids from indices
-        prod_list = [filtered_products[i] for i in indices]
+        return prod_list
 
-        span.set_attribute("app.filtered_products.list", prod_list)
+    def recommend(self, index, request_product_ids, excluded=None):
+        """Return (product ids, number of same-category picks) for one request."""
+        max_responses = 5
+        if excluded is None:
+            excluded = index.present(request_product_ids)
+        self.rec_svc_metrics["app_recommendation_candidates"].record(len(index) - len(excluded))
+        self.popular_products.record(request_product_ids)
+        if self.strategy == 'category':
+            return index.sample_related(max_responses, request_product_ids, excluded)
+        return index.sample(max_responses, excluded), 0
+
+    def check_feature_flag(self, flag_name: str):
+        # Served from the local flag snapshot, see flags.py
+        return self.flag_cache.get_boolean(flag_name, False)
+
+    async def check_feature_flag_async(self, flag_name: str):
+        # A snapshot miss may evaluate through flagd, which blocks
+        value = self.flag_cache.peek_boolean(flag_name, False)
+        if value is None:
+            value = await asyncio.to_thread(self.check_feature_flag, flag_name)
+        return value
 
-        return prod_list
+
+class RecommendationService(demo_pb2_grpc.RecommendationServiceServicer):
+    def __init__(self, app):
+        self.app = app
+
+    def ListRecommendations(self, request, context):
+        start = time.perf_counter()
+        try:
+            prod_list = self.app.get_product_list(request.product_ids)
+            return self.app.build_response(prod_list)
+        finally:
+            self.app.record_request_duration('ListRecommendations', start)
+
+    def ListRecommendationsBatch(self, request, context):
+        start = time.perf_counter()
+        try:
+            prod_lists = self.app.get_product_lists(request.requests)
+            return self.app.build_batch_response(prod_lists)
+        finally:
+            self.app.record_request_duration('ListRecommendationsBatch', start)
+
+    def StreamRecommendationsBatch(self, request, context):
+        app = self.app
+        start = time.perf_counter()
+        # Not made current: the span stays open across yields to the gRPC runtime
+        span = app.tracer.start_span("get_product_lists")
+        try:
+            index = app.recommendation_index(span)
+            yield from stream_batch_responses(app.iter_recommendations(span, index, request.requests))
+        finally:
+            span.end()
+            app.record_request_duration('StreamRecommendationsBatch', start)
+
+
+class AsyncRecommendationService(demo_pb2_grpc.RecommendationServiceServicer):
+    """grpc.aio servicer, handlers never block the event loop on the product catalog."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def ListRecommendations(self, request, context):
+        start = time.perf_counter()
+        try:
+            prod_list = await self.app.get_product_list_async(request.product_ids)
+            return self.app.build_response(prod_list)
+        finally:
+            self.app.record_request_duration('ListRecommendations', start)
+
+    async def ListRecommendationsBatch(self, request, context):
+        start = time.perf_counter()
+        try:
+            prod_lists = await self.app.get_product_lists_async(request.requests)
+            return self.app.build_batch_response(prod_lists)
+        finally:
+            self.app.record_request_duration('ListRecommendationsBatch', start)
+
+    async def StreamRecommendationsBatch(self, request, context):
+        app = self.app
+        start = time.perf_counter()
+        span = app.tracer.start_span("get_product_lists")
+        try:
+            index = await app.recommendation_index_async(span)
+            for response in stream_batch_responses(app.iter_recommendations(span, index, request.requests)):
+                yield response
+        finally:
+            span.end()
+            app.record_request_duration('StreamRecommendationsBatch', start)
+
+
+def stream_batch_responses(prod_lists):
+    for prod_list in prod_lists:
+        yield demo_pb2.ListRecommendationsResponse(product_ids=prod_list)
+
+
+def recommendation_type(index):
+    return 'popular' if isinstance(index, PopularIndex) else 'catalog'
 
 
 def must_map_env(key: str):
@@ -120,16 +354,211 @@ def must_map_env(key: str):
     return value
 
 
-def check_feature_flag(flag_name: str):
-    # Initialize OpenFeature
-    client = api.get_client()
-    return client.get_boolean_value("recommendationCacheFailure", False)
+def create_catalog_client(app, catalog_addr, aio=False):
+    hedging_delay_ms = os.environ.get('PRODUCT_CATALOG_HEDGING_DELAY_MS')
+    return CatalogClient(
+        catalog_addr,
+        channels=int(os.environ.get('PRODUCT_CATALOG_CHANNELS', 2)),
+        timeout=float(os.environ.get('PRODUCT_CATALOG_TIMEOUT_MS', 5000)) / 1000,
+        max_attempts=int(os.environ.get('PRODUCT_CATALOG_MAX_ATTEMPTS', 3)),
+        hedging_delay=float(hedging_delay_ms) / 1000 if hedging_delay_ms else None,
+        keepalive_time_ms=int(os.environ.get('PRODUCT_CATALOG_KEEPALIVE_TIME_MS', 300000)),
+        keepalive_timeout_ms=int(os.environ.get('PRODUCT_CATALOG_KEEPALIVE_TIMEOUT_MS', 20000)),
+        compression=os.environ.get('PRODUCT_CATALOG_COMPRESSION', 'none'),
+        max_message_bytes=int(os.environ.get('PRODUCT_CATALOG_MAX_MESSAGE_BYTES', 4 * 1024 * 1024)),
+        in_flight_counter=app.rec_svc_metrics["app_catalog_client_in_flight"],
+        aio=aio,
+    )
 
 
-if __name__ == "__main__":
-    service_name = must_map_env('OTEL_SERVICE_NAME')
-    api.set_provider(FlagdProvider(host=os.environ.get('FLAGD_HOST', 'flagd'), port=os.environ.get('FLAGD_PORT', 8013)))
-    api.add_hooks([TracingHook()])
+def timed_fetch(app, fetch):
+    duration = app.rec_svc_metrics["app_catalog_fetch_duration"]
+
+    def fetch_products():
+        start = time.perf_counter()
+        outcome = 'error'
+        try:
+            products = fetch()
+            outcome = 'ok'
+            return products
+        finally:
+            duration.record(time.perf_counter() - start, {'outcome': outcome})
+    return fetch_products
+
+
+def create_catalog_cache(app, fetch):
+    """Build app.catalog_cache over fetch: TTL + size bounded, refreshed in the
+    background and persisted on every change."""
+    path = snapshot_path('catalog.bin')
+    cache = CatalogCache(
+        fetch=timed_fetch(app, fetch),
+        build=ProductIndex.from_products,
+        ttl=float(os.environ.get('CATALOG_CACHE_TTL_SECONDS', 60)),
+        max_stale=float(os.environ.get('CATALOG_CACHE_MAX_STALE_SECONDS', 300)),
+        max_products=int(os.environ.get('CATALOG_CACHE_MAX_PRODUCTS', 100000)),
+        on_change=(lambda snapshot: catalog_snapshot.save(path, snapshot.value)) if path else None,
+        on_revalidate=(lambda snapshot: catalog_snapshot.touch(path)) if path else None,
+    )
+    if path:
+        seed_catalog_cache(cache, path)
+    observe_catalog_cache(app.meter, cache)
+    app.catalog_cache = cache
+    return cache
+
+
+def seed_catalog_cache(cache, path):
+    """Seed the cache with the catalog snapshot a previous process persisted, if any."""
+    loaded = catalog_snapshot.load(path)
+    if loaded is None:
+        return
+    index, saved_at = loaded
+    age = time.time() - saved_at
+    if not cache.seed(index, len(index), age):
+        logger.info("Ignoring catalog snapshot %s, last revalidated %.0fs ago, past the cache's max staleness",
+                    path, age)
+        return
+    logger.info("Loaded %d catalog products from %s, last revalidated %.0fs ago", len(index), path, age)
+
+
+def server_options():
+    options = []
+    max_concurrent_streams = os.environ.get('RECOMMENDATION_MAX_CONCURRENT_STREAMS')
+    if max_concurrent_streams:
+        options.append(('grpc.max_concurrent_streams', int(max_concurrent_streams)))
+    return options
+
+
+def max_concurrent_rpcs():
+    # None lets gRPC accept every RPC; beyond the limit new RPCs fail with RESOURCE_EXHAUSTED
+    value = os.environ.get('RECOMMENDATION_MAX_CONCURRENT_RPCS')
+    return int(value) if value else None
+
+
+def create_limiter(app, queue_depth=None):
+    """Adaptive concurrency limiter, or None when RECOMMENDATION_LIMITER=off."""
+    if os.environ.get('RECOMMENDATION_LIMITER', 'aimd') == 'off':
+        return None
+    limiter = ConcurrencyLimiter(
+        AIMDLimit(
+            initial=int(os.environ.get('RECOMMENDATION_LIMITER_INITIAL', 20)),
+            min_limit=int(os.environ.get('RECOMMENDATION_LIMITER_MIN', 4)),
+            max_limit=int(os.environ.get('RECOMMENDATION_LIMITER_MAX', 200)),
+            backoff_ratio=float(os.environ.get('RECOMMENDATION_LIMITER_BACKOFF_RATIO', 0.9)),
+            latency_threshold=float(os.environ.get('RECOMMENDATION_LIMITER_LATENCY_MS', 100)) / 1000,
+        ),
+        queue_depth=queue_depth,
+        rejected_counter=app.rec_svc_metrics["app_recommendation_limiter_rejected"],
+    )
+    observe_limiter(app.meter, limiter)
+    return limiter
+
+
+def create_health_monitor(app, queue_depth=None):
+    """Health status from catalog cache freshness, popular products and, given
+    queue_depth, executor saturation."""
+    app.health_monitor = HealthMonitor(
+        app.catalog_cache,
+        popular_products=app.popular_products,
+        queue_depth=queue_depth,
+        max_queue_depth=int(os.environ.get('RECOMMENDATION_HEALTH_MAX_QUEUE_DEPTH', 50)),
+        interval=float(os.environ.get('RECOMMENDATION_HEALTH_INTERVAL_MS', 250)) / 1000,
+    )
+    observe_health(app.meter, app.health_monitor)
+    return app.health_monitor
+
+
+def create_threaded_server(app, port):
+    """Build the threaded gRPC server and the app's catalog cache; returns (server, bound port)."""
+    create_catalog_cache(app, app.catalog_client.list_products).start()
+
+    # Create gRPC server
+    max_workers = int(os.environ.get('RECOMMENDATION_MAX_WORKERS', 10))
+    executor = AdmissionExecutor(max_workers=max_workers)
+    observe_executor(app.meter, executor)
+    limiter = create_limiter(app, queue_depth=executor._work_queue.qsize)
+    server = grpc.server(executor,
+                         interceptors=[ConcurrencyLimitInterceptor(limiter)] if limiter else [],
+                         options=server_options(),
+                         maximum_concurrent_rpcs=max_concurrent_rpcs())
+
+    # Add class to gRPC server
+    service = RecommendationService(app)
+    demo_pb2_grpc.add_RecommendationServiceServicer_to_server(service, server)
+    health_servicer = HealthServicer()
+    health_pb2_grpc.add_HealthServicer_to_server(health_servicer, server)
+    create_health_monitor(app, queue_depth=executor._work_queue.qsize).start(health_servicer)
+
+    return server, server.add_insecure_port(f'[::]:{port}')
+
+
+def warm_up(app, startup):
+    catalog_cache = app.catalog_cache
+    popular_products = app.popular_products
+    startup_duration = app.rec_svc_metrics["app_recommendation_startup_duration"]
+    seeded = catalog_cache.warm
+
+    def on_ready():
+        if not seeded:
+            startup.ready(startup_duration)
+        popular_products.refresh(catalog_cache.snapshot.value)
+
+    # Started before the catalog is cached, so request counts decay even if it never is
+    popular_products.start(lambda: catalog_cache.snapshot.value if catalog_cache.snapshot else None,
+                           interval=float(os.environ.get('RECOMMENDATION_POPULAR_REFRESH_SECONDS', 60)))
+
+    # Serve health checks (NOT_SERVING) right away, SERVING once the catalog is
+    # cached; a cache seeded from the catalog snapshot is ready as it is
+    if seeded:
+        startup.ready(startup_duration)
+    catalog_cache.warm_up(on_ready=on_ready)
+
+
+def serve_threaded(app, port, startup):
+    server, port = create_threaded_server(app, port)
+
+    # Start server
+    server.start()
+    startup.mark('listening')
+    logger.info(f'Recommendation service started (threaded), listening on port {port}')
+    warm_up(app, startup)
+    server.wait_for_termination()
+
+
+async def serve_async(app, port, catalog_addr, startup):
+    # Catalog refreshes run on the cache's own threads and hand the RPC to this
+    # event loop through the grpc.aio client
+    loop = asyncio.get_running_loop()
+    aio_catalog_client = create_catalog_client(app, catalog_addr, aio=True)
+    create_catalog_cache(
+        app, lambda: asyncio.run_coroutine_threadsafe(aio_catalog_client.alist_products(), loop).result()).start()
+
+    limiter = create_limiter(app)
+    server = grpc.aio.server(interceptors=[AsyncConcurrencyLimitInterceptor(limiter)] if limiter else [],
+                             options=server_options(),
+                             maximum_concurrent_rpcs=max_concurrent_rpcs())
+    service = AsyncRecommendationService(app)
+    demo_pb2_grpc.add_RecommendationServiceServicer_to_server(service, server)
+    health_servicer = AsyncHealthServicer()
+    health_pb2_grpc.add_HealthServicer_to_server(health_servicer, server)
+    await create_health_monitor(app).start_async(health_servicer)
+
+    server.add_insecure_port(f'[::]:{port}')
+    await server.start()
+    startup.mark('listening')
+    logger.info(f'Recommendation service started (async), listening on port {port}')
+    warm_up(app, startup)
+    await server.wait_for_termination()
+
+
+def init_telemetry(service_name):
+    """Attach the OTLP log handler; returns the tracer, meter and service metrics."""
+    from opentelemetry._logs import set_logger_provider
+    from opentelemetry.exporter.otlp.proto.grpc._log_exporter import (
+        OTLPLogExporter,
+    )
+    from opentelemetry.sdk._logs import LoggerProvider, LoggingHandler
+    from opentelemetry.sdk._logs.export import BatchLogRecordProcessor
+    from opentelemetry.sdk.resources import Resource
 
     # Initialize Traces and Metrics
     tracer = trace.get_tracer_provider().get_tracer(service_name)
@@ -149,25 +578,101 @@ if __name__ == "__main__":
     logger_provider.add_log_record_processor(BatchLogRecordProcessor(log_exporter))
     handler = LoggingHandler(level=logging.NOTSET, logger_provider=logger_provider)
 
+    # Optional JSON logs on stdout, encoded and written by a background thread
+    if os.environ.get('RECOMMENDATION_JSON_LOGS', 'false').lower() == 'true':
+        from logger import getJSONLogger
+        getJSONLogger('main', queue_size=int(os.environ.get('RECOMMENDATION_LOG_QUEUE_SIZE', 10000)),
+                      dropped_counter=rec_svc_metrics["app_log_records_dropped"])
+
     # Attach OTLP handler to logger
-    logger = logging.getLogger('main')
     logger.addHandler(handler)
+    return tracer, meter, rec_svc_metrics
 
-    catalog_addr = must_map_env('PRODUCT_CATALOG_ADDR')
-    pc_channel = grpc.insecure_channel(catalog_addr)
-    product_catalog_stub = demo_pb2_grpc.ProductCatalogServiceStub(pc_channel)
 
-    # Create gRPC server
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+def init_flags(rec_svc_metrics):
+    """Return the local flag snapshot and connect the flagd provider in the background.
 
-    # Add class to gRPC server
-    service = RecommendationService()
-    demo_pb2_grpc.add_RecommendationServiceServicer_to_server(service, server)
-    health_pb2_grpc.add_HealthServicer_to_server(service, server)
+    Until flagd is connected flags evaluate to their defaults; its PROVIDER_READY
+    event then drops those from the snapshot.
+    """
+    # Local feature flag snapshot, invalidated by flagd configuration change events
+    flag_cache = FlagCache(
+        ttl=float(os.environ.get('FLAG_CACHE_TTL_SECONDS', 5)),
+        avoided_counter=rec_svc_metrics["app_flag_evaluations_avoided_counter"],
+    )
+    flag_cache.subscribe()
 
-    # Start server
+    def connect():
+        from openfeature.contrib.hook.opentelemetry import TracingHook
+        from openfeature.contrib.provider.flagd import FlagdProvider
+
+        api.add_hooks([TracingHook()])
+        api.set_provider(FlagdProvider(host=os.environ.get('FLAGD_HOST', 'flagd'), port=os.environ.get('FLAGD_PORT', 8013)))
+
+    threading.Thread(target=connect, name='flagd-connect', daemon=True).start()
+    return flag_cache
+
+
+def snapshot_path(name):
+    """Path of a local snapshot file, or None when RECOMMENDATION_SNAPSHOT_DIR is empty."""
+    directory = os.environ.get('RECOMMENDATION_SNAPSHOT_DIR', '/tmp/recommendation')
+    return os.path.join(directory, name) if directory else None
+
+
+def create_popular_products():
+    """Popular products for degraded mode, loaded from the last snapshot if there is one."""
+    popular_products = PopularProducts(
+        size=int(os.environ.get('RECOMMENDATION_POPULAR_SIZE', 20)),
+        path=snapshot_path('popular.json'),
+    )
+    if popular_products.load():
+        logger.info("Loaded %d popular products from %s", len(popular_products.index), popular_products.path)
+    return popular_products
+
+
+def telemetry_policy():
+    return TelemetryPolicy(
+        verbosity=os.environ.get('TELEMETRY_VERBOSITY', 'full'),
+        max_list_items=int(os.environ.get('TELEMETRY_MAX_LIST_ITEMS', 16)),
+        max_value_length=int(os.environ.get('TELEMETRY_MAX_VALUE_LENGTH', 256)),
+    )
+
+
+def create_app(service_name, catalog_addr):
+    """Set up telemetry, feature flags and the product catalog client; returns the RecommendationApp.
+
+    The gRPC server and the catalog cache are then built by serve_threaded()
+    or serve_async().
+    """
+    tracer, meter, rec_svc_metrics = init_telemetry(service_name)
+    app = RecommendationApp(
+        tracer, meter, rec_svc_metrics,
+        flag_cache=init_flags(rec_svc_metrics),
+        popular_products=create_popular_products(),
+        telemetry=telemetry_policy(),
+        strategy=os.environ.get('RECOMMENDATION_STRATEGY', 'category'),
+        fallback_budget=float(os.environ.get('RECOMMENDATION_FALLBACK_BUDGET_MS', 200)) / 1000,
+    )
+    # Pooled product catalog channels with keepalive, deadlines and retries
+    app.catalog_client = create_catalog_client(app, catalog_addr)
+    return app
+
+
+def main():
+    startup = StartupTimer(budget=float(os.environ.get('RECOMMENDATION_STARTUP_BUDGET_MS', 5000)) / 1000)
+    startup.mark('imports')
+
+    catalog_addr = must_map_env('PRODUCT_CATALOG_ADDR')
+    app = create_app(must_map_env('OTEL_SERVICE_NAME'), catalog_addr)
+    startup.mark('initialized')
+
+    # 'threaded' (grpc.server + thread pool) or 'async' (grpc.aio)
     port = must_map_env('RECOMMENDATION_PORT')
-    server.add_insecure_port(f'[::]:{port}')
-    server.start()
-    logger.info(f'Recommendation service started, listening on port {port}')
-    server.wait_for_termination()
+    if os.environ.get('RECOMMENDATION_SERVER_MODE', 'threaded') == 'async':
+        asyncio.run(serve_async(app, port, catalog_addr, startup))
+    else:
+        serve_threaded(app, port, startup)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Start-up phase timing against a time budget.
+
+Phases are measured from the creation of the process, so interpreter start-up
+and the opentelemetry-instrument bootstrap count as well. When the service
+becomes ready every phase is recorded on the start-up duration histogram and
+logged, as a warning if readiness took longer than the budget.
+"""
+
+import logging
+import time
+
+import psutil
+
+logger = logging.getLogger('main')
+
+
+class StartupTimer:
+    def __init__(self, budget, clock=time.monotonic):
+        """
+        budget: seconds from process creation to ready, exceeding it is logged as a warning
+        """
+        self.budget = budget
+        self._clock = clock
+        # psutil's create_time is wall clock, moved onto the monotonic clock once
+        self._origin = clock() - (time.time() - psutil.Process().create_time())
+        self.phases = {}
+
+    def mark(self, phase):
+        """Record that ``phase`` ended now; returns the seconds since process creation."""
+        elapsed = self._clock() - self._origin
+        self.phases[phase] = elapsed
+        return elapsed
+
+    def ready(self, histogram=None):
+        elapsed = self.mark('ready')
+        if histogram is not None:
+            for phase, seconds in self.phases.items():
+                histogram.record(seconds, {'startup.phase': phase})
+        summary = ', '.join(f'{phase}={seconds * 1000:.0f}ms' for phase, seconds in self.phases.items())
+        if elapsed > self.budget:
+            logger.warning("Recommendation service ready after %.0f ms, over the %.0f ms start-up budget (%s)",
+                           elapsed * 1000, self.budget * 1000, summary)
+        else:
+            logger.info("Recommendation service ready after %.0f ms (%s)", elapsed * 1000, summary)
+        return elapsed
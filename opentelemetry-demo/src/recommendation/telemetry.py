@@ -0,0 +1,55 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""How much per-request telemetry the recommendation service records.
+
+Verbosity levels:
+
+* ``full``: counts, cache states and the recommended ids (capped), one INFO
+  log per request
+* ``basic``: counts and cache states only, request logs at DEBUG
+* ``off``: no per-request ``app.*`` span attributes or request logs
+
+Attribute work is skipped altogether for spans that are not recorded (e.g.
+sampled out), see ``records()``. Lists and strings are capped to
+``max_list_items`` items and ``max_value_length`` characters.
+"""
+
+import logging
+
+OFF = 'off'
+BASIC = 'basic'
+FULL = 'full'
+
+LEVELS = {OFF: 0, BASIC: 1, FULL: 2}
+
+
+class TelemetryPolicy:
+    __slots__ = ('verbosity', 'level', 'max_list_items', 'max_value_length', 'request_log_level')
+
+    def __init__(self, verbosity=FULL, max_list_items=16, max_value_length=256):
+        if verbosity not in LEVELS:
+            raise ValueError(f'unknown telemetry verbosity {verbosity!r}, expected one of {", ".join(LEVELS)}')
+        self.verbosity = verbosity
+        self.level = LEVELS[verbosity]
+        self.max_list_items = max_list_items
+        self.max_value_length = max_value_length
+        # Logged lazily: arguments are only formatted if a handler accepts the record
+        self.request_log_level = {OFF: None, BASIC: logging.DEBUG, FULL: logging.INFO}[verbosity]
+
+    def records(self, span, verbosity=BASIC):
+        """Whether attributes of this verbosity should be set on span."""
+        return self.level >= LEVELS[verbosity] and span.is_recording()
+
+    def cap(self, value):
+        """Truncate a string or sequence attribute value to the configured sizes."""
+        if isinstance(value, str):
+            return value[:self.max_value_length]
+        limit = self.max_value_length
+        return [x[:limit] if isinstance(x, str) else x for x in value[:self.max_list_items]]
+
+    def log_request(self, logger, msg, *args):
+        if self.request_log_level is not None:
+            logger.log(self.request_log_level, msg, *args, stacklevel=2)
@@ -1,26 +1,40 @@
 from flask import Flask, jsonify, request
 from flask_cors import CORS
 import psycopg2
-from psycopg2.extras import RealDictCursor
 import random 
 import time   
 import os
 import logging
 from psycopg2 import errors as pg_errors 
+import slow_queries
+import queries
+import timing
+from singleflight import SingleFlight
+from timing import TimedCursor, TimedRealDictCursor, timed_jsonify
 
 
 app = Flask(__name__)
 CORS(app) # Habilite CORS para permitir requisições do frontend
 logging.getLogger('werkzeug').setLevel(logging.ERROR)
+timing.init_app(app) # Server-Timing por requisição e histogramas em /metrics
+
+# Parâmetros de conexão com o banco de dados
+DB_CONFIG = {
+    'host': os.environ.get('DB_HOST', 'localhost'),
+    'database': os.environ.get('DB_NAME', 'appdb'), # Substitua pelo nome do seu DB
+    'user': os.environ.get('DB_USER', 'appuser'),           # Substitua pelo seu usuário
+    'password': os.environ.get('DB_PASSWORD', 'apppassword') # Substitua pela sua senha
+}
+slow_queries.init_app(app, DB_CONFIG) # Planos das consultas lentas em /debug/slow-queries
+products_flight = SingleFlight('products') # Coalescência de leituras idênticas em GET /products
 
 # Função para obter conexão com o banco de dados
 def get_db_connection():
-    conn = psycopg2.connect(
-        host=os.environ.get('DB_HOST', 'localhost'),
-        database=os.environ.get('DB_NAME', 'appdb'), # Substitua pelo nome do seu DB
-        user=os.environ.get('DB_USER', 'appuser'),           # Substitua pelo seu usuário
-        password=os.environ.get('DB_PASSWORD', 'apppassword') # Substitua pela sua senha
-    )
+    with timing.timed('db_connect'):
+        conn = psycopg2.connect(
+            **DB_CONFIG,
+            cursor_factory=TimedCursor # Cursores medem execute/fetch (ver timing.py)
+        )
     return conn
 
 # Rota principal (pode ser ajustada)
@@ -31,30 +45,35 @@ def index():
 # GET /products (Listar e Pesquisar Produtos)
 @app.route('/products', methods=['GET'])
 def get_products():
+    search_query = request.args.get('search', '') # Captura o parâmetro 'search' da URL
+    # Paginação opcional: ?limit=N&offset=M (sem 'limit' retorna tudo, como antes)
+    limit = request.args.get('limit', type=int)
+    offset = request.args.get('offset', 0, type=int)
+    try:
+        # Requisições idênticas e simultâneas esperam a mesma consulta em andamento
+        # e compartilham o JSON já serializado (ver singleflight.py)
+        body = products_flight.do((search_query, limit, offset),
+                                  lambda: query_products(search_query, limit, offset))
+        return app.response_class(body, mimetype='application/json')
+    except Exception as e:
+        print(f"Erro ao recuperar produtos: {e}")
+        return jsonify({"error": "Não foi possível recuperar os produtos."}), 500
+
+# Consulta e serializa os produtos de GET /products (executada apenas pelo líder do single-flight)
+def query_products(search_query, limit, offset):
     conn = None
     try:
         conn = get_db_connection()
-        cur = conn.cursor(cursor_factory=RealDictCursor)
-
-        search_query = request.args.get('search', '') # Captura o parâmetro 'search' da URL
+        cur = conn.cursor(cursor_factory=TimedRealDictCursor)
        # time.sleep(2) # Atraso de 2 segundos
 
-        if search_query:
-            # Esta pesquisa por nome ou descrição (case-insensitive) com ILIKE '%term%'
-            # será LENTA em um grande volume de dados se não houver um índice de trigram
-            # ou se o '%` estiver no início, impedindo o uso de índices B-tree comuns.
-            cur.execute("SELECT * FROM products WHERE name ILIKE %s OR description ILIKE %s",
-                        (f"%{search_query}%", f"%{search_query}%"))
-        else:
-            # Retorna todos os produtos se não houver termo de pesquisa
-            cur.execute("SELECT * FROM products")
+        # Busca ILIKE por nome/descrição e paginação opcional (ver queries.py)
+        sql, params = queries.products_query(search_query, limit, offset)
+        cur.execute(sql, params)
 
         products = cur.fetchall()
         cur.close()
-        return jsonify(products)
-    except Exception as e:
-        print(f"Erro ao recuperar produtos: {e}")
-        return jsonify({"error": "Não foi possível recuperar os produtos."}), 500
+        return timed_jsonify(products).get_data()
     finally:
         if conn:
             conn.close()
@@ -126,7 +145,7 @@ def slow_search_products():
     conn = None
     try:
         conn = get_db_connection()
-        cur = conn.cursor(cursor_factory=RealDictCursor)
+        cur = conn.cursor(cursor_factory=TimedRealDictCursor)
 
         # SIMULAÇÃO DE LENTIDÃO NO BANCO DE DADOS:
         # 1. Consulta com ORDER BY RANDOM() em uma tabela grande é muito ineficiente,
@@ -138,7 +157,7 @@ def slow_search_products():
 
         # Opção 1: ORDER BY RANDOM() - Clássico exemplo de consulta lenta
         print("SIMULANDO LENTIDÃO INTENCIONAL: ORDER BY RANDOM()")
-        cur.execute("SELECT id, name, description, price FROM products ORDER BY RANDOM() LIMIT 10;")
+        cur.execute(queries.SLOW_SEARCH_SQL)
 
         # Opção 2: Pesquisa com ILIKE em colunas não indexadas (se o termo for 'fascinante' ou 'qualidade', que populamos)
         # Descomente esta linha e comente a Opção 1 para testar
@@ -156,11 +175,11 @@ def slow_search_products():
         # time.sleep(1.0) # Atraso de 1 segundo (1000 milissegundos)
 
         # Executa uma consulta simples para buscar todos os produtos
-        cur.execute("SELECT * FROM products")
+        cur.execute(*queries.products_query('', None, 0))
         
         products = cur.fetchall()
         cur.close()
-        return jsonify(products)
+        return timed_jsonify(products)
     except Exception as e:
         print(f"Erro ao recuperar produtos lentos: {e}")
         return jsonify({"error": "Não foi possível recuperar os produtos lentos."}), 500
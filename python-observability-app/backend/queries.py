@@ -0,0 +1,27 @@
+# backend/queries.py
+"""
+SQL das rotas de produtos, num módulo sem efeitos colaterais para que
+tests/benchmark_backend.py reproduza exatamente as consultas do backend.
+"""
+
+# Opção 1 de /products/slow-search: ORDER BY RANDOM() lê e ordena a tabela inteira
+SLOW_SEARCH_SQL = "SELECT id, name, description, price FROM products ORDER BY RANDOM() LIMIT 10;"
+
+
+def products_query(search_query, limit, offset):
+    """Consulta de GET /products; devolve (sql, params)."""
+    if search_query:
+        # Esta pesquisa por nome ou descrição (case-insensitive) com ILIKE '%term%'
+        # será LENTA em um grande volume de dados se não houver um índice de trigram
+        # ou se o '%` estiver no início, impedindo o uso de índices B-tree comuns.
+        sql = "SELECT * FROM products WHERE name ILIKE %s OR description ILIKE %s"
+        params = [f"%{search_query}%", f"%{search_query}%"]
+    else:
+        # Retorna todos os produtos se não houver termo de pesquisa
+        sql = "SELECT * FROM products"
+        params = []
+
+    if limit is not None:
+        sql += " ORDER BY id LIMIT %s OFFSET %s"
+        params += [max(limit, 0), max(offset, 0)]
+    return sql, params
@@ -0,0 +1,87 @@
+# backend/singleflight.py
+"""
+Coalescência de leituras idênticas e simultâneas (padrão "single-flight").
+
+Em rajadas, vários clientes pedem o mesmo GET /products?search=Monitor ao mesmo
+tempo e cada um abriria sua própria conexão para repetir o mesmo full scan.
+Com SingleFlight.do(key, fn), a primeira requisição (líder) executa fn() e as
+que chegarem com a mesma chave enquanto ela está em andamento (seguidoras)
+apenas esperam e recebem o mesmo resultado já serializado. Não há cache: assim
+que o líder termina a chave é liberada, e a próxima requisição consulta o banco
+de novo.
+
+Métricas em /metrics (ver timing.py):
+    backend_singleflight_requests_total{name, role="leader"|"follower"}
+    backend_singleflight_coalesced_ratio{name}  fração de requisições atendidas como seguidoras
+"""
+import os
+import threading
+
+import timing
+
+ENABLED = os.environ.get('SINGLEFLIGHT_ENABLED', 'true').lower() in ('true', '1', 'yes', 'on')
+
+
+class _Call:
+    __slots__ = ('done', 'result', 'error', 'followers')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.followers = 0
+
+
+class SingleFlight:
+    """Executa no máximo uma chamada em andamento por chave; as demais aguardam o resultado."""
+
+    def __init__(self, name):
+        self.name = name
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.leaders = 0
+        self.followers = 0
+        labels = (('name', name),)
+        timing.registry.gauge('backend_singleflight_coalesced_ratio', labels, self.coalesced_ratio,
+                              'Fração das leituras atendidas por uma consulta já em andamento.')
+
+    def coalesced_ratio(self):
+        total = self.leaders + self.followers
+        return round(self.followers / total, 4) if total else 0.0
+
+    def do(self, key, fn):
+        """Retorna o resultado de fn() para 'key', compartilhando-o entre chamadas simultâneas."""
+        if not ENABLED:
+            return fn()
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                leader = True
+                self.leaders += 1
+            else:
+                call.followers += 1
+                leader = False
+                self.followers += 1
+
+        role = 'leader' if leader else 'follower'
+        timing.registry.inc('backend_singleflight_requests_total', (('name', self.name), ('role', role)), 1,
+                            'Leituras por papel no single-flight (líder consulta o banco, seguidora reaproveita).')
+        timing.annotate('singleflight', role)
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
@@ -0,0 +1,217 @@
+# backend/slow_queries.py
+"""
+Amostrador de consultas lentas com captura automática do plano de execução.
+
+Toda consulta executada por um cursor de timing.py é comparada com um limite de
+latência. As consultas SELECT acima do limite têm o plano capturado com
+EXPLAIN (ANALYZE, BUFFERS) em uma thread de fundo, usando uma conexão própria
+de um pool separado — a requisição que disparou a amostra não espera por isso.
+
+Os planos são deduplicados pela impressão digital (fingerprint) da consulta
+normalizada (literais trocados por '?'), e os N mais recentes ficam em um
+buffer circular exposto em GET /debug/slow-queries.
+
+Configuração por variáveis de ambiente:
+    SLOW_QUERY_THRESHOLD_MS         limite de latência (padrão 500)
+    SLOW_QUERY_BUFFER_SIZE          planos mantidos no buffer (padrão 50)
+    SLOW_QUERY_REEXPLAIN_SECONDS    intervalo antes de recapturar o mesmo fingerprint (padrão 300)
+    SLOW_QUERY_EXPLAIN_TIMEOUT_MS   statement_timeout do EXPLAIN ANALYZE (padrão 30000)
+    SLOW_QUERY_SAMPLER_ENABLED      'false' desliga o amostrador
+"""
+import hashlib
+import os
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from flask import has_request_context, jsonify
+from psycopg2 import pool as pg_pool
+
+import timing
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+_SELECT = re.compile(r"^\s*(?:/\*.*?\*/\s*)*select\b", re.IGNORECASE | re.DOTALL)
+
+# Limite de EXPLAINs aguardando na fila; acima disso as amostras são descartadas.
+MAX_PENDING = 4
+
+
+def normalize_query(sql):
+    """Troca literais por '?' e normaliza espaços/caixa para agrupar consultas iguais."""
+    sql = _STRING_LITERAL.sub('?', sql)
+    sql = _NUMBER_LITERAL.sub('?', sql)
+    return _WHITESPACE.sub(' ', sql).strip().rstrip(';').lower()
+
+
+def fingerprint(normalized_sql):
+    return hashlib.sha1(normalized_sql.encode('utf-8')).hexdigest()[:16]
+
+
+class SlowQuerySampler:
+    """Amostra consultas acima do limite e mantém os últimos planos em um ring buffer."""
+
+    def __init__(self, threshold_ms, buffer_size, reexplain_seconds, explain_timeout_ms, connect_kwargs):
+        self.threshold_ms = threshold_ms
+        self.reexplain_seconds = reexplain_seconds
+        self.explain_timeout_ms = explain_timeout_ms
+        self._connect_kwargs = connect_kwargs
+        self._pool = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='slow-query-explain')
+        self._entries = deque(maxlen=buffer_size)
+        self._by_fingerprint = {}
+        self._pending = {}  # fingerprint -> ocorrências enquanto o EXPLAIN não termina
+        self._lock = threading.Lock()
+        self.stats = {'sampled': 0, 'explained': 0, 'deduplicated': 0, 'dropped': 0,
+                      'skipped_non_select': 0, 'errors': 0}
+
+    def _get_pool(self):
+        # Criado sob demanda: o pool só existe se alguma consulta lenta aparecer.
+        if self._pool is None:
+            self._pool = pg_pool.ThreadedConnectionPool(0, 1, **self._connect_kwargs)
+        return self._pool
+
+    def observe(self, cursor, elapsed_ms):
+        """Observador de timing.py; no caminho rápido custa só uma comparação."""
+        if elapsed_ms < self.threshold_ms:
+            return
+        raw = cursor.query
+        if raw is None:
+            return
+        sql = raw.decode('utf-8', errors='replace') if isinstance(raw, bytes) else raw
+        with self._lock:
+            self.stats['sampled'] += 1
+        normalized = normalize_query(sql)
+        if not _SELECT.match(sql) or ';' in normalized:
+            # EXPLAIN ANALYZE executa a consulta de verdade: só é seguro para um único SELECT.
+            with self._lock:
+                self.stats['skipped_non_select'] += 1
+            return
+
+        fp = fingerprint(normalized)
+        route = timing.route_label() if has_request_context() else None
+        now = time.time()
+        with self._lock:
+            entry = self._by_fingerprint.get(fp)
+            if entry is not None and now - entry['captured_at_epoch'] < self.reexplain_seconds:
+                entry['occurrences'] += 1
+                entry['max_duration_ms'] = max(entry['max_duration_ms'], round(elapsed_ms, 2))
+                self.stats['deduplicated'] += 1
+                return
+            if fp in self._pending:
+                self._pending[fp] += 1
+                self.stats['deduplicated'] += 1
+                return
+            if len(self._pending) >= MAX_PENDING:
+                self.stats['dropped'] += 1
+                return
+            self._pending[fp] = entry['occurrences'] + 1 if entry is not None else 1
+        self._executor.submit(self._explain, fp, normalized, sql, route, elapsed_ms)
+
+    def _explain(self, fp, normalized, sql, route, elapsed_ms):
+        try:
+            plan, error, explain_ms = self._capture_plan(fp, sql)
+            self._record(fp, normalized, sql, route, elapsed_ms, plan, error, explain_ms)
+        finally:
+            # Sem isso, uma falha inesperada deixaria o fingerprint preso como "pendente"
+            with self._lock:
+                self._pending.pop(fp, None)
+
+    def _capture_plan(self, fp, sql):
+        plan, error, explain_ms = None, None, None
+        conn = None
+        try:
+            db_pool = self._get_pool()
+            conn = db_pool.getconn()
+            cur = conn.cursor()
+            cur.execute("SET LOCAL statement_timeout = %s", (int(self.explain_timeout_ms),))
+            t0 = time.perf_counter()
+            cur.execute("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + sql.strip().rstrip(';'))
+            plan = cur.fetchone()[0]
+            explain_ms = round((time.perf_counter() - t0) * 1000.0, 2)
+            cur.close()
+        except Exception as e:
+            error = str(e).strip().replace('\n', ' ')
+            print(f"Erro ao capturar plano da consulta lenta {fp}: {error}")
+        finally:
+            if conn is not None:
+                self._release(conn)
+        return plan, error, explain_ms
+
+    def _release(self, conn):
+        try:
+            conn.rollback()  # Nada a confirmar: descarta qualquer efeito do EXPLAIN
+        except Exception as e:
+            # Conexão quebrada (ex.: Postgres reiniciado): fecha em vez de devolvê-la,
+            # para que o pool (de uma única conexão) abra uma nova na próxima amostra
+            print(f"Descartando conexão do amostrador de consultas lentas: {e}")
+            self._pool.putconn(conn, close=True)
+        else:
+            self._pool.putconn(conn)
+
+    def _record(self, fp, normalized, sql, route, elapsed_ms, plan, error, explain_ms):
+        now = time.time()
+        entry = {
+            'fingerprint': fp,
+            'normalized_query': normalized,
+            'sample_query': sql,
+            'route': route,
+            'duration_ms': round(elapsed_ms, 2),
+            'max_duration_ms': round(elapsed_ms, 2),
+            'occurrences': 0,
+            'captured_at': datetime.fromtimestamp(now, timezone.utc).isoformat(timespec='seconds'),
+            'captured_at_epoch': now,
+            'explain_duration_ms': explain_ms,
+            'plan': plan,
+            'error': error,
+        }
+        with self._lock:
+            entry['occurrences'] = self._pending.pop(fp, 1)
+            old = self._by_fingerprint.pop(fp, None)
+            if old is not None:
+                try:
+                    self._entries.remove(old)
+                except ValueError:
+                    pass
+            if len(self._entries) == self._entries.maxlen:
+                evicted = self._entries.popleft()
+                self._by_fingerprint.pop(evicted['fingerprint'], None)
+            self._entries.append(entry)
+            self._by_fingerprint[fp] = entry
+            self.stats['errors' if error else 'explained'] += 1
+
+    def snapshot(self):
+        with self._lock:
+            entries = [dict(e) for e in reversed(self._entries)]  # mais recentes primeiro
+            stats = dict(self.stats)
+        for e in entries:
+            e.pop('captured_at_epoch', None)
+        return {
+            'threshold_ms': self.threshold_ms,
+            'buffer_size': self._entries.maxlen,
+            'stats': stats,
+            'entries': entries,
+        }
+
+
+sampler = None
+
+
+def init_app(app, connect_kwargs):
+    """Liga o amostrador aos cursores instrumentados e registra a rota de debug."""
+    global sampler
+    if os.environ.get('SLOW_QUERY_SAMPLER_ENABLED', 'true').lower() not in ('true', '1', 'yes', 'on'):
+        return
+    sampler = SlowQuerySampler(
+        threshold_ms=float(os.environ.get('SLOW_QUERY_THRESHOLD_MS', 500)),
+        buffer_size=int(os.environ.get('SLOW_QUERY_BUFFER_SIZE', 50)),
+        reexplain_seconds=float(os.environ.get('SLOW_QUERY_REEXPLAIN_SECONDS', 300)),
+        explain_timeout_ms=float(os.environ.get('SLOW_QUERY_EXPLAIN_TIMEOUT_MS', 30000)),
+        connect_kwargs=connect_kwargs,
+    )
+    timing.add_query_observer(sampler.observe)
+    app.add_url_rule('/debug/slow-queries', 'slow_queries', lambda: jsonify(sampler.snapshot()), methods=['GET'])
@@ -0,0 +1,275 @@
+# backend/timing.py
+"""
+Instrumentação leve do caminho quente do backend.
+
+Mede, por requisição, quanto tempo foi gasto em cada fase:
+    db_connect  -> get_db_connection()
+    db_execute  -> cur.execute()
+    db_fetch    -> cur.fetchall()/fetchone()/fetchmany()
+    json_encode -> timed_jsonify()
+além do número de consultas executadas. Os tempos são devolvidos no cabeçalho
+Server-Timing de cada resposta e agregados em histogramas por rota, expostos em
+formato Prometheus na rota /metrics.
+
+O custo por fase é uma chamada a time.perf_counter() e uma soma em um dict da
+requisição; os histogramas usam buckets fixos e um lock curto, então a
+instrumentação pode ficar ligada em produção. Para desligar, defina
+REQUEST_TIMING_ENABLED=false.
+"""
+import bisect
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from flask import Response, g, has_request_context, jsonify, request
+from psycopg2.extensions import cursor as _PgCursor
+from psycopg2.extras import RealDictCursor
+
+ENABLED = os.environ.get('REQUEST_TIMING_ENABLED', 'true').lower() in ('true', '1', 'yes', 'on')
+
+PHASES = ('db_connect', 'db_execute', 'db_fetch', 'json_encode')
+
+# Buckets em milissegundos (le="...") dos histogramas de duração.
+DURATION_BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+# Buckets de consultas por requisição.
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 25)
+
+
+class Histogram:
+    """Histograma cumulativo no estilo Prometheus, seguro para múltiplas threads."""
+
+    __slots__ = ('buckets', 'counts', 'sum', 'count', '_lock')
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # último slot = +Inf
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def snapshot(self):
+        with self._lock:
+            return list(self.counts), self.sum, self.count
+
+
+class Registry:
+    """Conjunto de métricas do processo, indexadas por (nome, labels)."""
+
+    def __init__(self):
+        self._histograms = {}
+        self._counters = {}
+        self._gauges = {}
+        self._help = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, name, labels, buckets, help_text=''):
+        key = (name, labels)
+        hist = self._histograms.get(key)
+        if hist is None:
+            with self._lock:
+                hist = self._histograms.setdefault(key, Histogram(buckets))
+                self._help.setdefault(name, ('histogram', help_text))
+        return hist
+
+    def inc(self, name, labels=(), amount=1, help_text=''):
+        key = (name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+            self._help.setdefault(name, ('counter', help_text))
+
+    def gauge(self, name, labels, callback, help_text=''):
+        """Registra um gauge cujo valor é calculado por callback() a cada leitura de /metrics."""
+        with self._lock:
+            self._gauges[(name, labels)] = callback
+            self._help.setdefault(name, ('gauge', help_text))
+
+    def render(self):
+        """Serializa todas as métricas no formato de exposição texto do Prometheus."""
+        lines = []
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+            counters = sorted(self._counters.items())
+            gauges = sorted(self._gauges.items(), key=lambda item: item[0])
+            help_map = dict(self._help)
+        emitted = set()
+
+        def header(name):
+            if name not in emitted:
+                emitted.add(name)
+                kind, help_text = help_map[name]
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+
+        for (name, labels), hist in histograms:
+            header(name)
+            counts, total, count = hist.snapshot()
+            base = ','.join(f'{k}="{v}"' for k, v in labels)
+            sep = ',' if base else ''
+            cumulative = 0
+            for bound, bucket_count in zip(hist.buckets, counts):
+                cumulative += bucket_count
+                lines.append(f'{name}_bucket{{{base}{sep}le="{bound}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{{base}{sep}le="+Inf"}} {count}')
+            lines.append(f'{name}_sum{{{base}}} {total}')
+            lines.append(f'{name}_count{{{base}}} {count}')
+        for (name, labels), value in counters:
+            header(name)
+            base = ','.join(f'{k}="{v}"' for k, v in labels)
+            lines.append(f'{name}{{{base}}} {value}')
+        for (name, labels), callback in gauges:
+            header(name)
+            base = ','.join(f'{k}="{v}"' for k, v in labels)
+            lines.append(f'{name}{{{base}}} {callback()}')
+        return '\n'.join(lines) + '\n'
+
+
+registry = Registry()
+
+
+# --- Registro das fases na requisição corrente ---
+
+def record(phase, elapsed_ms):
+    """Acumula elapsed_ms na fase 'phase' da requisição corrente (se houver uma)."""
+    if ENABLED and has_request_context():
+        timings = g.get('request_timings')
+        if timings is not None:
+            timings[phase] += elapsed_ms
+
+
+# Funções chamadas com (cursor, elapsed_ms) após cada execute() bem-sucedido.
+_query_observers = []
+
+
+def add_query_observer(observer):
+    """Registra um observador de consultas (ex.: o amostrador de slow_queries.py)."""
+    _query_observers.append(observer)
+
+
+def route_label():
+    """Rota (url_rule) da requisição corrente, usada como label das métricas."""
+    rule = request.url_rule
+    return rule.rule if rule is not None else 'unmatched'
+
+
+def annotate(name, desc):
+    """Acrescenta uma entrada 'name;desc="..."' ao Server-Timing da requisição corrente."""
+    if ENABLED and has_request_context() and 'request_timings' in g:
+        g.request_annotations.append((name, desc))
+
+
+@contextmanager
+def timed(phase):
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(phase, (time.perf_counter() - t0) * 1000.0)
+
+
+class TimedCursorMixin:
+    """Mede execute/fetch* e conta as consultas da requisição."""
+
+    def execute(self, query, vars=None):
+        t0 = time.perf_counter()
+        try:
+            result = super().execute(query, vars)
+        finally:
+            elapsed_ms = (time.perf_counter() - t0) * 1000.0
+            record('db_execute', elapsed_ms)
+            if ENABLED and has_request_context() and 'request_timings' in g:
+                g.request_query_count += 1
+        for observer in _query_observers:
+            observer(self, elapsed_ms)
+        return result
+
+    def fetchall(self):
+        t0 = time.perf_counter()
+        try:
+            return super().fetchall()
+        finally:
+            record('db_fetch', (time.perf_counter() - t0) * 1000.0)
+
+    def fetchone(self):
+        t0 = time.perf_counter()
+        try:
+            return super().fetchone()
+        finally:
+            record('db_fetch', (time.perf_counter() - t0) * 1000.0)
+
+    def fetchmany(self, size=None):
+        t0 = time.perf_counter()
+        try:
+            return super().fetchmany(size) if size is not None else super().fetchmany()
+        finally:
+            record('db_fetch', (time.perf_counter() - t0) * 1000.0)
+
+
+class TimedCursor(TimedCursorMixin, _PgCursor):
+    """Cursor padrão (tuplas) instrumentado."""
+
+
+class TimedRealDictCursor(TimedCursorMixin, RealDictCursor):
+    """RealDictCursor instrumentado."""
+
+
+def timed_jsonify(*args, **kwargs):
+    """jsonify() com o tempo de serialização registrado na fase json_encode."""
+    with timed('json_encode'):
+        return jsonify(*args, **kwargs)
+
+
+# --- Integração com o Flask ---
+
+def _before_request():
+    g.request_timings = dict.fromkeys(PHASES, 0.0)
+    g.request_query_count = 0
+    g.request_annotations = []
+    g.request_started = time.perf_counter()
+
+
+def _after_request(response):
+    timings = g.get('request_timings')
+    if timings is None:
+        return response
+    total_ms = (time.perf_counter() - g.request_started) * 1000.0
+    route = route_label()
+    queries = g.request_query_count
+
+    parts = [f"{phase};dur={ms:.2f}" for phase, ms in timings.items() if ms]
+    parts.append(f"total;dur={total_ms:.2f}")
+    parts.append(f'db_queries;desc="{queries}"')
+    parts.extend(f'{name};desc="{desc}"' for name, desc in g.request_annotations)
+    response.headers['Server-Timing'] = ', '.join(parts)
+
+    labels = (('route', route),)
+    registry.histogram('backend_request_duration_ms', labels, DURATION_BUCKETS_MS,
+                       'Duração total da requisição em milissegundos.').observe(total_ms)
+    for phase, ms in timings.items():
+        if ms:
+            registry.histogram('backend_request_phase_duration_ms', (('route', route), ('phase', phase)),
+                               DURATION_BUCKETS_MS,
+                               'Tempo gasto por fase (conexão, execução, fetch, JSON) em milissegundos.').observe(ms)
+    registry.histogram('backend_db_queries_per_request', labels, QUERY_COUNT_BUCKETS,
+                       'Número de consultas ao banco por requisição.').observe(queries)
+    registry.inc('backend_db_queries_total', labels, queries, 'Total de consultas executadas no banco.')
+    return response
+
+
+def metrics_endpoint():
+    return Response(registry.render(), mimetype='text/plain; version=0.0.4')
+
+
+def init_app(app):
+    """Registra os hooks de medição e a rota /metrics no app Flask."""
+    app.add_url_rule('/metrics', 'metrics', metrics_endpoint, methods=['GET'])
+    if ENABLED:
+        app.before_request(_before_request)
+        app.after_request(_after_request)
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+# database/generate_catalog.py
+"""
+Gerador de catálogo sintético para a tabela products.
+
+Substitui o INSERT fixo de 100.000 linhas do init.sql quando queremos testar as
+rotas de listagem e pesquisa em escala de produção (de 1 mil a 100 milhões de
+produtos). Os nomes e descrições usam vocabulários realistas com frequência
+enviesada (distribuição de Zipf), e os termos mais frequentes são os mesmos que
+o tests/traffic_generator.py pesquisa ("Monitor", "Teclado", "Mouse", "Gamer",
+"UltraWide", "Full HD", "USB").
+
+A carga é feita com COPY em paralelo (um processo e uma conexão por worker) e
+os índices/constraints só são criados depois da carga, o que é muito mais rápido
+do que manter o índice UNIQUE atualizado linha a linha.
+
+Uso (com o ambiente virtual do backend ativo, que já tem o psycopg2):
+    python3 database/generate_catalog.py --rows 1000000
+    python3 database/generate_catalog.py --rows 50000000 --workers 8 --zipf 1.2
+"""
+import argparse
+import bisect
+import io
+import itertools
+import os
+import random
+import time
+from multiprocessing import Pool
+
+import psycopg2
+
+MIN_ROWS = 1_000
+MAX_ROWS = 100_000_000
+# Ids por tarefa de carga. Fixo, para que o catálogo gerado dependa só de
+# --rows, --zipf e --seed (e não de --workers ou --batch-size).
+CHUNK_ROWS = 100_000
+
+# Produtos fixos do catálogo original (bkp_init.sql). 'Monitor UltraWide' precisa
+# existir para que /products/db-error-test?type=unique_violation continue falhando.
+SEED_PRODUCTS = [
+    ('Monitor UltraWide', 'Monitor de 34 polegadas, resolução 2560x1080.', 799.99),
+    ('Teclado Mecânico', 'Teclado com switches Cherry MX Blue e RGB.', 129.50),
+    ('Mouse Gamer', 'Mouse com sensor óptico de alta precisão e 12 botões programáveis.', 59.90),
+    ('Webcam Full HD', 'Webcam com resolução 1080p a 60fps.', 85.00),
+    ('Headset Surround 7.1', 'Fone de ouvido com áudio surround virtual 7.1 e microfone retrátil.', 150.00),
+]
+
+# --- Vocabulários (ordenados do mais frequente para o menos frequente) ---
+# A posição na lista é o "rank" usado na distribuição de Zipf, então os termos
+# pesquisados pelo gerador de tráfego ficam no topo.
+PRODUCT_TYPES = [
+    "Monitor", "Teclado", "Mouse", "Notebook", "Smartphone", "Fone de Ouvido",
+    "Câmera", "Smartwatch", "Webcam", "Headset", "Impressora", "Roteador",
+    "Tablet", "Caixa de Som", "Microfone", "Cadeira", "Mousepad", "Hub",
+    "SSD", "HD Externo", "Placa de Vídeo", "Processador", "Memória RAM",
+    "Fonte", "Gabinete", "Projetor", "Estabilizador", "Nobreak",
+]
+MODIFIERS = [
+    "Gamer", "UltraWide", "Full HD", "USB", "Sem Fio", "Mecânico", "Bluetooth",
+    "4K", "RGB", "Compacto", "Profissional", "Ergonômico", "Slim", "Pro",
+    "Portátil", "Curvo", "Silencioso", "Premium", "Básico", "Wi-Fi 6",
+]
+BRANDS = [
+    "Orion", "Vértice", "Nébula", "Atlas", "Cobalto", "Quasar", "Boreal",
+    "Titã", "Aurora", "Zênite", "Pampa", "Ipê", "Jaguar", "Tucano", "Sertão",
+]
+FEATURES = [
+    "conexão USB", "resolução Full HD", "tela UltraWide", "iluminação RGB",
+    "ideal para gamers", "bateria de longa duração", "design ergonômico",
+    "conexão Bluetooth", "alta precisão", "garantia de 12 meses",
+    "baixo consumo de energia", "acabamento em alumínio", "cabo removível",
+    "compatível com Windows, Linux e macOS", "som estéreo", "montagem sem ferramentas",
+    "modo silencioso", "atualização de firmware", "suporte VESA", "carregamento rápido",
+]
+OPENINGS = [
+    "Um {tipo} {marca} de alta qualidade",
+    "O {tipo} {marca} mais vendido da linha",
+    "{tipo} {marca} pensado para o dia a dia",
+    "Novo {tipo} {marca} com ótimo custo-benefício",
+    "{tipo} {marca} para escritório e home office",
+]
+
+
+def zipf_cum_weights(n, s):
+    """Pesos acumulados de uma distribuição de Zipf com expoente s para n ranks."""
+    total = 0.0
+    cum = []
+    for rank in range(1, n + 1):
+        total += 1.0 / (rank ** s)
+        cum.append(total)
+    return cum
+
+
+class ZipfChoice:
+    """Sorteia itens de uma lista com probabilidade proporcional a 1/rank^s."""
+
+    def __init__(self, items, s):
+        self.items = items
+        self.cum = zipf_cum_weights(len(items), s)
+        self.total = self.cum[-1]
+
+    def __call__(self, rng):
+        return self.items[bisect.bisect_left(self.cum, rng.random() * self.total)]
+
+
+def copy_escape(value):
+    """Escapa um valor para o formato texto do COPY (tabulação como separador)."""
+    return value.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n')
+
+
+def generate_rows(start_id, end_id, seed, zipf_s):
+    """Gera as linhas [start_id, end_id) no formato do COPY, uma string por linha."""
+    rng = random.Random(seed)
+    tipo = ZipfChoice(PRODUCT_TYPES, zipf_s)
+    modificador = ZipfChoice(MODIFIERS, zipf_s)
+    marca = ZipfChoice(BRANDS, zipf_s)
+    recurso = ZipfChoice(FEATURES, zipf_s)
+    for product_id in range(start_id, end_id):
+        t = tipo(rng)
+        m = marca(rng)
+        # O sufixo com o id garante a unicidade de 'name' (constraint UNIQUE).
+        name = f"{t} {m} {modificador(rng)} {product_id:09d}"
+        features = {recurso(rng) for _ in range(rng.randint(1, 3))}
+        description = rng.choice(OPENINGS).format(tipo=t.lower(), marca=m)
+        description = f"{description[0].upper()}{description[1:]}, com {', '.join(sorted(features))}."
+        price = round(rng.lognormvariate(5.0, 1.0), 2)
+        price = min(max(price, 1.0), 99_999_999.99)  # NUMERIC(10, 2)
+        yield f"{product_id}\t{copy_escape(name)}\t{copy_escape(description)}\t{price:.2f}\n"
+
+
+def db_params():
+    """Mesmas variáveis de ambiente usadas por get_db_connection() no backend."""
+    return {
+        'host': os.environ.get('DB_HOST', 'localhost'),
+        'database': os.environ.get('DB_NAME', 'appdb'),
+        'user': os.environ.get('DB_USER', 'appuser'),
+        'password': os.environ.get('DB_PASSWORD', 'apppassword'),
+    }
+
+
+def load_chunk(args):
+    """Worker: carrega um intervalo de ids via COPY em lotes de batch_size linhas."""
+    start_id, end_id, seed, zipf_s, batch_size = args
+    conn = psycopg2.connect(**db_params())
+    try:
+        cur = conn.cursor()
+        # A tabela é recém-criada e sem índices: não precisamos de fsync por commit.
+        cur.execute("SET synchronous_commit TO off")
+        rows = generate_rows(start_id, end_id, seed, zipf_s)
+        while True:
+            batch = list(itertools.islice(rows, batch_size))
+            if not batch:
+                break
+            cur.copy_expert("COPY products (id, name, description, price) FROM STDIN",
+                            io.StringIO(''.join(batch)))
+        conn.commit()
+        cur.close()
+    finally:
+        conn.close()
+    return end_id - start_id
+
+
+def prepare_table(conn):
+    """Recria a tabela products sem índices nem constraints (criados após a carga)."""
+    cur = conn.cursor()
+    cur.execute("DROP TABLE IF EXISTS products")
+    cur.execute("""
+        CREATE TABLE products (
+            id SERIAL,
+            name VARCHAR(255) NOT NULL,
+            description TEXT,
+            price NUMERIC(10, 2) NOT NULL
+        )
+    """)
+    cur.executemany(
+        "INSERT INTO products (id, name, description, price) VALUES (%s, %s, %s, %s)",
+        [(i, name, desc, price) for i, (name, desc, price) in enumerate(SEED_PRODUCTS, start=1)]
+    )
+    conn.commit()
+    cur.close()
+
+
+def build_indexes(conn, total_rows, trigram):
+    """Cria PK, UNIQUE e (opcionalmente) índices de trigram depois da carga."""
+    cur = conn.cursor()
+    cur.execute("SET maintenance_work_mem TO '512MB'")
+    steps = [
+        ("chave primária", "ALTER TABLE products ADD CONSTRAINT products_pkey PRIMARY KEY (id)"),
+        ("UNIQUE(name)", "ALTER TABLE products ADD CONSTRAINT products_name_key UNIQUE (name)"),
+    ]
+    if trigram:
+        # Deixa as buscas ILIKE '%termo%' do backend rápidas. Por padrão NÃO criamos,
+        # porque a lentidão dessas buscas é justamente o cenário do laboratório.
+        steps += [
+            ("extensão pg_trgm", "CREATE EXTENSION IF NOT EXISTS pg_trgm"),
+            ("trigram(name)", "CREATE INDEX products_name_trgm_idx ON products USING gin (name gin_trgm_ops)"),
+            ("trigram(description)",
+             "CREATE INDEX products_description_trgm_idx ON products USING gin (description gin_trgm_ops)"),
+        ]
+    for label, sql in steps:
+        t0 = time.perf_counter()
+        cur.execute(sql)
+        conn.commit()
+        print(f"   - Índice {label} criado em {time.perf_counter() - t0:.1f}s")
+    # Mantém o SERIAL coerente para os INSERTs feitos pela API.
+    cur.execute("SELECT setval('products_id_seq', %s)", (total_rows,))
+    cur.execute("ANALYZE products")
+    conn.commit()
+    cur.close()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Gera e carrega um catálogo sintético na tabela products.")
+    parser.add_argument('--rows', type=int, default=100_000,
+                        help=f"Número total de produtos ({MIN_ROWS} a {MAX_ROWS}). Padrão: 100000.")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="Processos/conexões de COPY em paralelo. Padrão: número de CPUs.")
+    parser.add_argument('--batch-size', type=int, default=50_000,
+                        help="Linhas enviadas por comando COPY. Padrão: 50000.")
+    parser.add_argument('--zipf', type=float, default=1.1,
+                        help="Expoente de Zipf dos vocabulários (maior = mais enviesado). Padrão: 1.1.")
+    parser.add_argument('--seed', type=int, default=42, help="Semente para geração reprodutível.")
+    parser.add_argument('--trigram-indexes', action='store_true',
+                        help="Cria índices GIN de trigram em name e description (requer pg_trgm).")
+    args = parser.parse_args()
+    if not MIN_ROWS <= args.rows <= MAX_ROWS:
+        parser.error(f"--rows deve estar entre {MIN_ROWS} e {MAX_ROWS}.")
+    if args.workers < 1 or args.batch_size < 1:
+        parser.error("--workers e --batch-size devem ser positivos.")
+    return args
+
+
+def main():
+    args = parse_args()
+    print(f"Gerando {args.rows} produtos com {args.workers} workers (zipf={args.zipf}, seed={args.seed})...")
+
+    conn = psycopg2.connect(**db_params())
+    try:
+        t0 = time.perf_counter()
+        prepare_table(conn)
+
+        # Divide os ids restantes em blocos de tamanho fixo, cada um com sua
+        # própria semente, para que o resultado não dependa do número de workers.
+        first_id = len(SEED_PRODUCTS) + 1
+        tasks = [
+            (start, min(start + CHUNK_ROWS, args.rows + 1), args.seed * 1_000_003 + start, args.zipf, args.batch_size)
+            for start in range(first_id, args.rows + 1, CHUNK_ROWS)
+        ]
+        loaded = len(SEED_PRODUCTS)
+        with Pool(processes=min(args.workers, len(tasks) or 1)) as pool:
+            for count in pool.imap_unordered(load_chunk, tasks):
+                loaded += count
+                print(f"   - {loaded}/{args.rows} produtos carregados")
+        load_time = time.perf_counter() - t0
+        print(f"Carga concluída em {load_time:.1f}s ({loaded / load_time:,.0f} linhas/s). Criando índices...")
+
+        build_indexes(conn, args.rows, args.trigram_indexes)
+        print(f"Catálogo com {args.rows} produtos pronto em {time.perf_counter() - t0:.1f}s.")
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -19,7 +19,7 @@ SELECT
     'Produto ' || LPAD(s::text, 6, '0'), -- Ex: 'Produto 000001'
     'Descrição detalhada para o produto ' || LPAD(s::text, 6, '0') || '. Um item fascinante e de alta qualidade.',
     (RANDOM() * 1000)::NUMERIC(10,2) -- Preço aleatório entre 0 e 1000
-FROM generate_series(1, 100000) s; -- Altere para um número maior (ex: 1000000) se quiser mais dados
+FROM generate_series(1, 100000) s; -- Para volumes maiores e dados realistas, use database/generate_catalog.py --rows N
 
 -- Importante: Atualiza as estatísticas do otimizador do PostgreSQL após a inserção em massa
 ANALYZE products;
@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+# tests/benchmark_backend.py
+"""
+Benchmark repetível da API de produtos do backend.
+
+Sobe o backend (backend/app.py) contra o banco configurado pelas variáveis
+DB_HOST/DB_NAME/DB_USER/DB_PASSWORD — opcionalmente populando-o antes com
+database/generate_catalog.py — e executa cenários nomeados:
+
+    list_all, list_paginated, search_hit, search_miss, insert, delete, slow_search
+
+Para cada cenário são medidos vazão (req/s), percentis de latência, tempo de
+banco (DB time, do cabeçalho Server-Timing do backend) e pico de memória
+residente (RSS) do processo do backend. O resultado é gravado em JSON para que
+execuções em commits diferentes possam ser comparadas com --compare.
+
+Exemplos:
+    python3 benchmark_backend.py --seed-rows 1000000 --output bench.json
+    python3 benchmark_backend.py --url http://localhost:5000 --scenarios search_hit,search_miss
+    python3 benchmark_backend.py --output depois.json --compare antes.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import psycopg2
+import requests
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BACKEND_DIR = os.path.join(PROJECT_ROOT, 'backend')
+GENERATOR = os.path.join(PROJECT_ROOT, 'database', 'generate_catalog.py')
+
+# SQL das rotas (backend/queries.py), para que o replay execute as mesmas consultas
+sys.path.insert(0, BACKEND_DIR)
+import queries  # noqa: E402
+
+# Termos de busca do tests/traffic_generator.py
+SEARCH_HIT_TERMS = ["Monitor", "Teclado", "Mouse", "Gamer", "UltraWide", "Full HD", "USB"]
+SEARCH_MISS_TERMS = ["ProdutoInexistente", "XYZ"]
+
+DEFAULT_SCENARIOS = ['list_all', 'list_paginated', 'search_hit', 'search_miss',
+                     'insert', 'delete', 'slow_search']
+
+
+def db_params():
+    """Mesmas variáveis de ambiente usadas por get_db_connection() no backend."""
+    return {
+        'host': os.environ.get('DB_HOST', 'localhost'),
+        'database': os.environ.get('DB_NAME', 'appdb'),
+        'user': os.environ.get('DB_USER', 'appuser'),
+        'password': os.environ.get('DB_PASSWORD', 'apppassword'),
+    }
+
+
+# --- Cenários ---
+# Cada cenário recebe (session, base_url, i, state) e devolve a resposta HTTP.
+# 'sql' lista as consultas que a rota executa, usadas para medir o tempo de banco
+# diretamente quando o backend não envia Server-Timing.
+
+def _list_all(session, base_url, i, state):
+    return session.get(f"{base_url}/products")
+
+
+def _list_paginated(session, base_url, i, state):
+    return session.get(f"{base_url}/products", params={'limit': 50, 'offset': (i * 50) % 10_000})
+
+
+def _search_hit(session, base_url, i, state):
+    return session.get(f"{base_url}/products", params={'search': SEARCH_HIT_TERMS[i % len(SEARCH_HIT_TERMS)]})
+
+
+def _search_miss(session, base_url, i, state):
+    return session.get(f"{base_url}/products", params={'search': SEARCH_MISS_TERMS[i % len(SEARCH_MISS_TERMS)]})
+
+
+def _insert(session, base_url, i, state):
+    response = session.post(f"{base_url}/products", json={
+        'name': f"Benchmark {state['run_id']} {i:08d}",
+        'description': "Produto criado pelo benchmark do backend.",
+        'price': 10.0 + (i % 1000),
+    })
+    if response.status_code == 201:
+        with state['lock']:
+            state['created_ids'].append(response.json()['id'])
+    return response
+
+
+def _delete(session, base_url, i, state):
+    with state['lock']:
+        product_id = state['created_ids'].pop() if state['created_ids'] else None
+    if product_id is None:
+        raise StopIteration  # Não há mais produtos criados pelo cenário insert
+    return session.delete(f"{base_url}/products/{product_id}")
+
+
+def _slow_search(session, base_url, i, state):
+    return session.get(f"{base_url}/products/slow-search")
+
+
+SCENARIOS = {
+    'list_all': {'run': _list_all, 'sql': [queries.products_query('', None, 0)]},
+    'list_paginated': {'run': _list_paginated, 'sql': [queries.products_query('', 50, 0)]},
+    'search_hit': {'run': _search_hit, 'sql': [queries.products_query(SEARCH_HIT_TERMS[0], None, 0)]},
+    'search_miss': {'run': _search_miss, 'sql': [queries.products_query(SEARCH_MISS_TERMS[0], None, 0)]},
+    'insert': {'run': _insert, 'sql': None},
+    'delete': {'run': _delete, 'sql': None},
+    'slow_search': {'run': _slow_search,
+                    'sql': [(queries.SLOW_SEARCH_SQL, None), queries.products_query('', None, 0)]},
+}
+
+
+# --- Processo do backend ---
+
+def start_backend(port):
+    """Sobe o app Flask sem o reloader do modo debug, para que o PID seja o do servidor."""
+    code = f"import app; app.app.run(host='127.0.0.1', port={port}, threaded=True)"
+    proc = subprocess.Popen([sys.executable, '-c', code], cwd=BACKEND_DIR,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"Backend terminou durante a inicialização (código {proc.returncode}).")
+        try:
+            requests.get(f"{base_url}/", timeout=1)
+            return proc, base_url
+        except requests.exceptions.RequestException:
+            time.sleep(0.2)
+    proc.kill()
+    raise RuntimeError("Backend não respondeu em 30 segundos.")
+
+
+def reset_peak_rss(pid):
+    """Zera o pico de RSS (VmHWM) do processo; disponível no Linux >= 4.0."""
+    try:
+        with open(f"/proc/{pid}/clear_refs", 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def read_peak_rss_mb(pid):
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024.0
+    except OSError:
+        pass
+    return None
+
+
+# --- Medições ---
+
+def percentiles(samples):
+    if not samples:
+        return None
+    ordered = sorted(samples)
+
+    def pct(p):
+        return ordered[min(len(ordered) - 1, int(round(p / 100.0 * (len(ordered) - 1))))]
+
+    return {
+        'mean': round(statistics.fmean(ordered), 3),
+        'p50': round(pct(50), 3),
+        'p90': round(pct(90), 3),
+        'p95': round(pct(95), 3),
+        'p99': round(pct(99), 3),
+        'max': round(ordered[-1], 3),
+    }
+
+
+def measure_db_time(statements, samples):
+    """Executa as consultas do cenário direto no banco (execute + fetchall de cada uma)."""
+    if not statements or samples <= 0:
+        return None
+    timings = []
+    conn = psycopg2.connect(**db_params())
+    try:
+        cur = conn.cursor()
+        for _ in range(samples):
+            t0 = time.perf_counter()
+            for sql, params in statements:
+                cur.execute(sql, params)
+                cur.fetchall()
+            timings.append((time.perf_counter() - t0) * 1000.0)
+        cur.close()
+    finally:
+        conn.close()
+    return percentiles(timings)
+
+
+def parse_server_timing(header):
+    """Converte 'db_execute;dur=1.2, db_fetch;dur=0.4, ...' em {'db_execute': 1.2, ...}."""
+    phases = {}
+    for entry in header.split(','):
+        name, _, params = entry.strip().partition(';')
+        for param in params.split(';'):
+            key, _, value = param.partition('=')
+            if key.strip() == 'dur':
+                phases[name] = float(value)
+    return phases
+
+
+def run_scenario(name, base_url, args, state, pid):
+    scenario = SCENARIOS[name]
+    latencies = []
+    server_db_ms = []
+    errors = 0
+    exceptions = {}  # Falhas fora do HTTP (ex.: resposta inesperada), por tipo
+    lock = threading.Lock()
+    counter = iter(range(args.requests))
+    sessions = threading.local()
+    deadline = time.monotonic() + args.duration
+
+    def worker():
+        nonlocal errors
+        session = getattr(sessions, 'session', None)
+        if session is None:
+            session = sessions.session = requests.Session()
+        while time.monotonic() < deadline:
+            with lock:
+                i = next(counter, None)
+            if i is None:
+                return
+            t0 = time.perf_counter()
+            try:
+                response = scenario['run'](session, base_url, i, state)
+                ok = response.status_code < 400
+                phases = parse_server_timing(response.headers.get('Server-Timing', ''))
+            except StopIteration:
+                return
+            except requests.exceptions.RequestException:
+                ok, phases = False, {}
+            except Exception as e:
+                ok, phases = False, {}
+                with lock:
+                    exceptions[type(e).__name__] = exceptions.get(type(e).__name__, 0) + 1
+            elapsed = (time.perf_counter() - t0) * 1000.0
+            with lock:
+                latencies.append(elapsed)
+                if phases:
+                    server_db_ms.append(sum(phases.get(p, 0.0) for p in ('db_connect', 'db_execute', 'db_fetch')))
+                if not ok:
+                    errors += 1
+
+    rss_reset = pid is not None and reset_peak_rss(pid)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        futures = [pool.submit(worker) for _ in range(args.concurrency)]
+    wall = time.perf_counter() - started
+    for future in futures:
+        future.result()  # Propaga erros do próprio worker em vez de descartá-los
+
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'exceptions': exceptions,
+        'duration_s': round(wall, 3),
+        'throughput_rps': round(len(latencies) / wall, 2) if wall > 0 else None,
+        'latency_ms': percentiles(latencies),
+        # DB time reportado pelo próprio backend (cabeçalho Server-Timing); quando o
+        # backend não o envia, mede-se a consulta equivalente direto no banco.
+        'db_time_ms': percentiles(server_db_ms) or measure_db_time(scenario['sql'], args.db_samples),
+        'db_time_source': 'server-timing' if server_db_ms else 'replay',
+        'peak_rss_mb': round(read_peak_rss_mb(pid), 1) if pid is not None else None,
+        'peak_rss_scope': 'scenario' if rss_reset else 'process',
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current, baseline_path):
+    """Imprime a variação de vazão e p95 em relação a uma execução anterior."""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    print(f"\nComparação com {baseline_path} (commit {baseline['meta'].get('commit')}):")
+    for name, result in current['scenarios'].items():
+        old = baseline['scenarios'].get(name)
+        if not old or not old.get('latency_ms') or not result.get('latency_ms'):
+            continue
+        rps_delta = (result['throughput_rps'] / old['throughput_rps'] - 1) * 100 if old['throughput_rps'] else 0
+        p95_delta = (result['latency_ms']['p95'] / old['latency_ms']['p95'] - 1) * 100 if old['latency_ms']['p95'] else 0
+        print(f"  {name:15s} req/s {old['throughput_rps']:>9.1f} -> {result['throughput_rps']:>9.1f} ({rps_delta:+6.1f}%)"
+              f"   p95 {old['latency_ms']['p95']:>9.1f} -> {result['latency_ms']['p95']:>9.1f} ms ({p95_delta:+6.1f}%)")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark dos cenários da API de produtos.")
+    parser.add_argument('--url', help="Usa um backend já em execução em vez de subir um novo (sem medição de RSS).")
+    parser.add_argument('--port', type=int, default=5055, help="Porta do backend iniciado pelo benchmark.")
+    parser.add_argument('--seed-rows', type=int,
+                        help="Popula o banco com database/generate_catalog.py antes de rodar.")
+    parser.add_argument('--scenarios', default=','.join(DEFAULT_SCENARIOS),
+                        help="Lista de cenários separados por vírgula.")
+    parser.add_argument('--concurrency', type=int, default=4, help="Clientes simultâneos.")
+    parser.add_argument('--requests', type=int, default=200, help="Máximo de requisições por cenário.")
+    parser.add_argument('--duration', type=float, default=30.0, help="Tempo máximo por cenário (segundos).")
+    parser.add_argument('--warmup', type=int, default=3, help="Requisições de aquecimento por cenário.")
+    parser.add_argument('--db-samples', type=int, default=5,
+                        help="Execuções diretas no banco para medir o DB time (0 desativa).")
+    parser.add_argument('--output', default='benchmark_results.json', help="Arquivo JSON de saída.")
+    parser.add_argument('--compare', help="JSON de uma execução anterior para comparar.")
+    args = parser.parse_args()
+    unknown = set(args.scenarios.split(',')) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"Cenários desconhecidos: {', '.join(sorted(unknown))}")
+    return args
+
+
+def main():
+    args = parse_args()
+    scenarios = args.scenarios.split(',')
+
+    if args.seed_rows:
+        subprocess.run([sys.executable, GENERATOR, '--rows', str(args.seed_rows)], check=True)
+
+    proc = None
+    if args.url:
+        base_url, pid = args.url.rstrip('/'), None
+    else:
+        proc, base_url = start_backend(args.port)
+        pid = proc.pid
+
+    state = {'run_id': uuid.uuid4().hex[:8], 'created_ids': [], 'lock': threading.Lock()}
+    results = {
+        'meta': {
+            'commit': git_commit(),
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'url': base_url,
+            'seed_rows': args.seed_rows,
+            'concurrency': args.concurrency,
+            'max_requests': args.requests,
+            'python': platform.python_version(),
+        },
+        'scenarios': {},
+    }
+    try:
+        print(f"Benchmark em {base_url} (concorrência {args.concurrency})")
+        for name in scenarios:
+            with requests.Session() as session:
+                for i in range(args.warmup if name not in ('insert', 'delete') else 0):
+                    SCENARIOS[name]['run'](session, base_url, i, state)
+            result = run_scenario(name, base_url, args, state, pid)
+            results['scenarios'][name] = result
+            lat = result['latency_ms'] or {}
+            print(f"  {name:15s} {result['requests']:6d} req  {result['throughput_rps'] or 0:9.1f} req/s  "
+                  f"p50 {lat.get('p50', 0):8.1f} ms  p99 {lat.get('p99', 0):8.1f} ms  "
+                  f"erros {result['errors']}  RSS {result['peak_rss_mb']} MB")
+            if result['exceptions']:
+                print(f"  {'':15s} exceções: {result['exceptions']}")
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait(timeout=10)
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+    print(f"Resultados gravados em {args.output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()